@@ -1,11 +1,12 @@
 # Define the __all__ variable
-__all__ = ["constants", "density", "input_reader", "interpreter", "physics", "saturation_pressure"]
+__all__ = ("constants", "input_reader", "saturation_pressure", "density", "physics", "interpreter")
 
-# Import the submodules
-from . import constants
-from . import density
-from . import saturation_pressure
-from . import input_reader
-from . import interpreter
-from . import physics
-from . import saturation_pressure
+# Standard libraries
+import importlib
+
+
+# Import the submodules on first access, so that importing the package does not load scipy and matplotlib
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,15 +9,16 @@ The methods supported are:
     3. Hauer's method
 
 All methods take in a set of material dependent and environmental parameters and return a float value representing the
-density of the adsorbate in kg/m3. In case of different units needed, the output value can be converted using an
-external function. Changing the units in the functions is not recommended, as it may impact the functionality of the
-other modules using this code.
+density of the adsorbate in kg/m3. The temperature dependent methods, including the extrapolation, also accept numpy
+arrays of temperatures, in which case an array of densities is returned. In case of different units needed, the output
+value can be converted using an external function. Changing the units in the functions is not recommended, as it may
+impact the functionality of the other modules using this code.
 
 Usage:
 """
 
 # Standard libraries
-import math
+import functools
 import importlib.resources
 
 # Local libraries
@@ -26,7 +27,9 @@ from retmap import input_reader
 
 # Third-party libraries
 import numpy
-import scipy.interpolate
+
+# Constant part of the empirical density formula, 8 / R, including the conversion from g/cm3 to kg/m3
+EMPIRICAL_FACTOR = 8 * 1000 / constants.GAS_CONSTANT  # [mol*K/(cm3*MPa)]
 
 
 def empirical(pressure_critical: float, temperature_critical: float, molecular_mass: float) -> float:
@@ -37,13 +40,13 @@ def empirical(pressure_critical: float, temperature_critical: float, molecular_m
     :param molecular_mass: Molecular mass of the adsorbate in g/mol.
     :return: Density in kg/m3.
     """
-    return 8 * pressure_critical * molecular_mass / (constants.GAS_CONSTANT * temperature_critical) * 1000
+    return EMPIRICAL_FACTOR * pressure_critical * molecular_mass / temperature_critical
 
 
 def hauer(temperature: float, temperature_boiling: float, density_boiling: float,
           thermal_expansion_coefficient: float) -> float:
     """
-    Calculates the temperature dependent adsorbate density based on
+    Calculates the temperature dependent adsorbate density based on Hauer's method, represented by a linear formula.
     :param temperature: Temperature at which the experiment is conducted in K.
     :param temperature_boiling: Boiling temperature of the adsorbate in K.
     :param thermal_expansion_coefficient: Thermal expansion coefficient in the adsorbed phase in 1/K.
@@ -64,7 +67,23 @@ def ozawa(temperature: float, temperature_boiling: float, density_boiling: float
     :param thermal_expansion_coefficient: Thermal expansion coefficient in 1/K.
     :return: Density in kg/m3.
     """
-    return density_boiling * math.exp(-thermal_expansion_coefficient * (temperature - temperature_boiling))
+    return density_boiling * numpy.exp(-thermal_expansion_coefficient * (temperature - temperature_boiling))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_extrapolator(file) -> tuple:
+    """
+    Fit the line used above the range of a density data file and the slope used below it, cached per file.
+
+    :param file: Path to file containing reference data.
+    :return: Tuple containing the sorted temperatures, the matching densities, the coefficients of the linear fit, and
+    the slope of the first interval.
+    """
+    temperatures, densities = input_reader.create_sorted_columns(file)
+
+    coefficients = numpy.polyfit(temperatures, densities, deg=1)
+    first_slope = (densities[1] - densities[0]) / (temperatures[1] - temperatures[0])
+    return temperatures, densities, coefficients, first_slope
 
 
 def extrapolation(temperature: float, file: str, adsorbate_name: str = None) -> float:
@@ -72,27 +91,27 @@ def extrapolation(temperature: float, file: str, adsorbate_name: str = None) ->
     Calculates the density by extrapolating the data found in a data file.
 
     The target should be a two-column file, where the first column contains the temperature and the second one the
-    density. For the extrapolation, a second order polynomial is used. If the input temperature is found in
-    the temperature range covered by the data file, interpolation is used to determine the value.
+    density. If the input temperature is found in the temperature range covered by the data file, linear interpolation
+    is used to determine the value. Above the range, a linear least-squares fit of the data is used, while below it the
+    first interval of the data is extended.
 
-    :param temperature: Temperature at which the experiment is conducted in K.
+    :param temperature: Temperature at which the experiment is conducted in K, either a float or a numpy array.
     :param file: Path to file containing reference data.
-    :return: Density in the same units as the input file.
+    :return: Density in the same units as the input file, with the same shape as the temperature.
     """
 
     if file == "local":
         file = importlib.resources.files("retmap").joinpath(f"library/density/{adsorbate_name}.dat")
 
-    data = input_reader.create_data_list(file)
-    data = numpy.array(data)
+    temperatures, densities, coefficients, first_slope = _get_extrapolator(file)
 
-    def fit_function(x, a, b):
-        return a * x + b
+    temperature = numpy.asarray(temperature, dtype=float)
+    adsorbate_density = numpy.interp(temperature, temperatures, densities)
+    adsorbate_density = numpy.where(temperature > temperatures[-1], numpy.polyval(coefficients, temperature),
+                                    adsorbate_density)
+    adsorbate_density = numpy.where(temperature < temperatures[0],
+                                    densities[0] + first_slope * (temperature - temperatures[0]), adsorbate_density)
 
-    if temperature <= numpy.max(data[:, 0]):
-        interpolation_function = scipy.interpolate.CubicSpline(data[:, 0], data[:, 1], extrapolate=True)
-        return interpolation_function(temperature).item()
-    else:
-        # noinspection PyTupleAssignmentBalance
-        popt, pcov = scipy.optimize.curve_fit(fit_function, data[:, 0], data[:, 1])
-        return fit_function(temperature, *popt)
+    if adsorbate_density.ndim == 0:
+        return adsorbate_density.item()
+    return adsorbate_density
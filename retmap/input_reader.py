@@ -4,9 +4,13 @@ be interpreted by the main functions.
 """
 
 # Standard libraries
+import typing
 import warnings
 import importlib.resources
 
+# Third-party libraries
+import numpy
+
 
 DEFAULT_INPUT_DICTIONARY = {
     "DATA_FILES": None,
@@ -103,58 +107,82 @@ DEFAULT_PROPERTIES_DICTIONARY = {
 }
 
 
+INPUT_KEYS = frozenset(DEFAULT_INPUT_DICTIONARY)
+LIST_INPUT_KEYS = frozenset(LIST_INPUT_TAGS)
+PROPERTIES_KEYS = frozenset(DEFAULT_PROPERTIES_DICTIONARY)
+
+# Key-words naming a computation method, which are matched case-insensitively
+METHOD_INPUT_KEYS = frozenset({"ADSORBATE_SATURATION_PRESSURE", "ADSORBATE_DENSITY"})
+
+# Characters a token has to start with to be convertible to a float, including "inf" and "nan"
+FLOAT_START_CHARACTERS = frozenset("0123456789+-.iInN")
+
+
+def _convert_value(token: str):
+    """
+    Convert a token from the input or properties file to a float if possible, otherwise keep it as a string. Tokens that
+    cannot start a number, such as units or method names, are returned directly without attempting the conversion.
+    :param token: The token to convert.
+    :return: The converted token.
+    """
+    if token[0] not in FLOAT_START_CHARACTERS:
+        return token
+
+    try:
+        return float(token)
+    except ValueError:
+        return token
+
+
 def create_input_dictionary(path: str) -> dict:
     """
     Convert the input file to structured dictionary that can be read by the rest of the application.
 
     Open the input file and parse each line separately. If the first word on a line is part of the recognised key-words
     from DEFAULT_DICTIONARY then assign the following words as arguments, otherwise ignore the line. If there are
-    multiple data files and only one unique value assigned, use that value as argument for all files.
+    multiple data files and only one unique value assigned, use that value as argument for all files. The arguments of
+    a line are converted once and then distributed over the data files. Key-words from LIST_INPUT_TAGS are stored as
+    numpy arrays of floats, and the method names of METHOD_INPUT_KEYS are stored in lowercase.
     :param path: The path of the input file.
     :return: A structured dictionary.
     """
     input_dictionary = {}
+    number_data_files = 0
 
     with open(path, "rt") as input_file:
-        f = input_file.read()
-        lines = f.splitlines()
-        for line in lines:
+        for line in input_file:
 
-            if not line:
+            # Split off the key-word first, so that the arguments are split without shifting the list afterwards
+            line_parts = line.split(None, 1)
+            if not line_parts:
                 continue
 
-            line_input = line.split()
-            key_word = line_input[0]
-            line_input.pop(0)
+            key_word = line_parts[0]
+            line_input = line_parts[1].split() if len(line_parts) > 1 else []
+            if key_word in METHOD_INPUT_KEYS:
+                line_input = [token.lower() for token in line_input]
+            number_arguments = len(line_input)
 
             if key_word == "DATA_FILES":
-                for index, _ in enumerate(line_input):
-                    input_dictionary[index] = DEFAULT_INPUT_DICTIONARY.copy()
-
-            for index in input_dictionary.keys():
-                if key_word in DEFAULT_INPUT_DICTIONARY and key_word not in LIST_INPUT_TAGS and len(line_input) == len(input_dictionary):
-                    try:
-                        converted_type = float(line_input[index])
-                    except ValueError:
-                        input_dictionary[index][key_word] = line_input[index]
-                    else:
-                        input_dictionary[index][key_word] = converted_type
-                elif key_word in DEFAULT_INPUT_DICTIONARY and key_word not in LIST_INPUT_TAGS and len(line_input) == 1:
-                    try:
-                        converted_type = float(line_input[0])
-                    except ValueError:
-                        input_dictionary[index][key_word] = line_input[0]
-                    else:
-                        input_dictionary[index][key_word] = converted_type
-                elif key_word in LIST_INPUT_TAGS:
-                    input_dictionary[index][key_word] = []
-                    for line_input_index, _ in enumerate(line_input):
-                        try:
-                            converted_type = float(line_input[line_input_index])
-                        except ValueError:
-                            input_dictionary[index][key_word].append(line_input[line_input_index])
-                        else:
-                            input_dictionary[index][key_word].append(converted_type)
+                number_data_files = number_arguments
+                input_dictionary = {index: DEFAULT_INPUT_DICTIONARY.copy() for index in range(number_data_files)}
+
+            if key_word in LIST_INPUT_KEYS:
+                try:
+                    values = numpy.array(line_input, dtype=float)
+                except ValueError:
+                    raise ValueError(f"{key_word} in {path} only accepts numerical values. Check for spelling "
+                                     f"errors!")
+                for index in input_dictionary:
+                    input_dictionary[index][key_word] = values.copy()
+            elif key_word in INPUT_KEYS:
+                if number_arguments == number_data_files:
+                    for index, token in zip(input_dictionary, line_input):
+                        input_dictionary[index][key_word] = _convert_value(token)
+                elif number_arguments == 1:
+                    value = _convert_value(line_input[0])
+                    for index in input_dictionary:
+                        input_dictionary[index][key_word] = value
 
     return input_dictionary
 
@@ -165,7 +193,7 @@ def create_properties_dictionary(path: str, adsorbate_name: str) -> dict:
 
     Open the properties file and parse each line separately. If the first word on a line is part of the recognised
     key-words from DEFAULT_DICTIONARY then assign the following words as arguments, otherwise raise error. If there are
-    key-words from the dictionary that have no value assigned, raise a warning and continue.
+    key-words from the dictionary that have no value assigned, raise a single warning listing them and continue.
     :param path: The path of the properties file.
     :return: A structured dictionary.
     """
@@ -174,75 +202,75 @@ def create_properties_dictionary(path: str, adsorbate_name: str) -> dict:
     if path == "local":
         path = importlib.resources.files("retmap").joinpath(f"library/property/{adsorbate_name}.prop")
 
-    properties_source = open(path, "rt")
-    f = properties_source.read()
-
-    lines = f.splitlines()
-    for line in lines:
+    with open(path, "rt") as properties_source:
+        for line in properties_source:
 
-        if not line:
-            continue
+            # Only the key-word and the first argument are used
+            line_input = line.split(None, 2)
+            if not line_input:
+                continue
 
-        line_input = line.split()
-        key_word = line_input[0]
-        line_input.pop(0)
+            key_word = line_input[0]
 
-        if key_word in properties_dictionary:
-            try:
-                converted_type = float(line_input[0])
-            except ValueError:
-                properties_dictionary[key_word] = line_input[0]
+            if key_word in PROPERTIES_KEYS:
+                properties_dictionary[key_word] = _convert_value(line_input[1])
             else:
-                properties_dictionary[key_word] = converted_type
-        else:
-            raise ValueError(f"{key_word} in {path} is not a recognised tag for a properties file. Remove the "
-                             f"tag or check for spelling errors!")
-
-    properties_source.close()
+                raise ValueError(f"{key_word} in {path} is not a recognised tag for a properties file. Remove the "
+                                 f"tag or check for spelling errors!")
 
-    for key_word in properties_dictionary.keys():
-        if properties_dictionary[key_word] is None:
-            warnings.warn(f"{key_word} was not found in the properties file at {path}, which may be a requirement for "
-                          f"some methods. In case of errors please add the tag to the properties file!")
+    missing_key_words = [key_word for key_word, value in properties_dictionary.items() if value is None]
+    if missing_key_words:
+        warnings.warn(f"{', '.join(missing_key_words)} not found in the properties file at {path}, which may be a "
+                      f"requirement for some methods. In case of errors please add the tags to the properties file!")
 
     return properties_dictionary
 
 
-def create_data_list(path: str) -> list:
+def create_data_list(path: str) -> typing.Union[numpy.ndarray, list]:
     """
-    Convert the data files to a list.
-
-    Open the data file specified in the path and read it line by line, converting each entry to an integer or a float.
-    The parser supports comments when they are initialized using the "#" sign. The parser does not support strings in
-    the data files.
-    :param path: The path of the properties file.
-    :return: A list.
+    Convert the data files to a two-dimensional numpy array or, if the rows have different lengths, to a list of rows.
+
+    Rectangular data files, such as two-column files, are parsed directly into a two-dimensional numpy array using
+    numpy.loadtxt(). Files with rows of different lengths, such as the equation parameter files, cannot be represented
+    as an array, so they are read line by line instead, converting each entry to a float. The parser supports comments
+    when they are initialized using the "#" sign. The parser does not support strings in the data files.
+    :param path: The path of the data file.
+    :return: A two-dimensional numpy array for rectangular files, otherwise a list containing one list of floats per
+    row.
     """
 
-    properties_source = open(path, "rt")
-    f = properties_source.read()
+    try:
+        return numpy.loadtxt(path, comments="#", ndmin=2)
+    except ValueError:
+        pass
 
-    lines = f.splitlines()
     output = []
-    for line in lines:
-        if not line:
-            continue
+    with open(path, "rt") as data_source:
+        for line in data_source:
+            line = line.strip()
+            if not line:
+                continue
 
-        if line[0] == "#":
-            continue
+            if line[0] == "#":
+                continue
 
-        numbers = line.split()
-        row = []
-        for number in numbers:
             try:
-                value = float(number)
-                row.append(value)
-            except ValueError:
-                raise f"Wrong entry in the input file {path}!"
-
-        output.append(row)
+                row = [float(number) for number in line.split()]
+            except ValueError as error:
+                raise ValueError(f"Wrong entry {line!r} in the input file {path}!") from error
 
-    properties_source.close()
+            output.append(row)
 
     return output
 
+
+def create_sorted_columns(path: str) -> tuple:
+    """
+    Read a two-column data file, such as the reference data used by the extrapolation methods, and sort its rows by the
+    first column.
+    :param path: The path of the data file.
+    :return: Tuple containing the first and the second column as numpy arrays.
+    """
+    data = numpy.asarray(create_data_list(path), dtype=float)
+    data = data[numpy.argsort(data[:, 0])]
+    return data[:, 0], data[:, 1]
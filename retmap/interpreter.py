@@ -22,62 +22,261 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(filename="retmap.log", filemode="w+", level=logging.INFO, datefmt="%d-%m-%y %H:%M:%S",
                     format="%(asctime)s %(levelname)s -> %(message)s")
 
+# Plot style shared by all figures, applied only while plot_data draws so the global matplotlib settings are untouched
+FIGURE_SIZE = (7, 6)
+PLOT_STYLE = {
+    "axes.labelsize": "xx-large",
+    "xtick.labelsize": "xx-large",
+    "ytick.labelsize": "xx-large",
+    "legend.fontsize": "x-large"
+}
+
+# Growth factor and number of steps used to bracket the temperature boundaries around the initial guess
+BRACKET_FACTOR = 1.5
+BRACKET_STEPS = 10
+
+# Largest residual accepted for a bracketed root, relative to the values of the function at the ends of the bracket
+ROOT_TOLERANCE = 1e-6
+
+# Factors converting the supported input units to the standard ones: MPa, K, mg/g, kJ/mol, ml/g and kg/m3
+UNIT_CONVERSION_FACTORS = {
+    # Pressure
+    "MPa": 1,
+    "kPa": 0.001,
+    "Pa": 0.000001,
+    "bar": 0.1,
+    "atm": 0.09869232667160,
+    "Torr": 0.000133322,
+    "mmHg": 133.322 * 0.000001,
+
+    # Temperature
+    "K": 1,
+    "R": 1.8,
+
+    # Adsorbed amount
+    "mg/g": 1,
+    "g/kg": 1,
+
+    # Adsorption potential
+    "kJ/mol": 1,
+    "J/mol": 0.001,
+
+    # Adsorption volume
+    "ml/g": 1,
+    "l/kg": 1,
+    "cm3/g": 1,
+    "dm3/kg": 1,
+
+    # Density
+    "kg/m3": 1,
+}
+
+# Molar adsorbed amount units, converted to mg/g using the molecular mass
+MOLAR_UNITS = frozenset({"mol/kg", "mmol/g"})
+
+
+def _density_empirical(temperature: float, properties_dictionary: dict, input_dictionary: dict) -> float:
+    adsorbate_density = density.empirical(
+        pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
+        temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
+
+    # The empirical density does not depend on temperature, so repeat it for every temperature of an array
+    if isinstance(temperature, numpy.ndarray):
+        return numpy.full(temperature.shape, adsorbate_density)
+    return adsorbate_density
+
+
+def _density_hauer(temperature: float, properties_dictionary: dict, input_dictionary: dict) -> float:
+    return density.hauer(
+        temperature=temperature,
+        temperature_boiling=properties_dictionary['TEMPERATURE_BOILING'],
+        density_boiling=properties_dictionary['DENSITY_BOILING'],
+        thermal_expansion_coefficient=input_dictionary[0]['THERMAL_EXPANSION_COEFFICIENT'])
+
+
+def _density_ozawa(temperature: float, properties_dictionary: dict, input_dictionary: dict) -> float:
+    return density.ozawa(
+        temperature=temperature,
+        temperature_boiling=properties_dictionary['TEMPERATURE_BOILING'],
+        density_boiling=properties_dictionary['DENSITY_BOILING'],
+        thermal_expansion_coefficient=input_dictionary[0]['THERMAL_EXPANSION_COEFFICIENT'])
+
+
+def _density_extrapolation(temperature: float, properties_dictionary: dict, input_dictionary: dict) -> float:
+    return density.extrapolation(
+        temperature=temperature,
+        file=input_dictionary[0]['DENSITY_FILE'],
+        adsorbate_name=input_dictionary[0]['ADSORBATE'])
+
+
+DENSITY_METHODS = {
+    "empirical": _density_empirical,
+    "hauer": _density_hauer,
+    "ozawa": _density_ozawa,
+    "extrapolation": _density_extrapolation
+}
+
+
+def _saturation_pressure_dubinin(temperature: float, properties_dictionary: dict, saturation_pressure_file: str,
+                                 input_dictionary: dict) -> float:
+    return saturation_pressure.dubinin(
+        temperature=temperature,
+        temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
+        pressure_critical=properties_dictionary['PRESSURE_CRITICAL'])
+
+
+def _saturation_pressure_amankwah(temperature: float, properties_dictionary: dict, saturation_pressure_file: str,
+                                  input_dictionary: dict) -> float:
+    return saturation_pressure.amankwah(
+        temperature=temperature,
+        temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
+        pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
+        k=input_dictionary[0]['AMANKWAH_EXPONENT'])
+
+
+def _saturation_pressure_extrapolation(temperature: float, properties_dictionary: dict, saturation_pressure_file: str,
+                                       input_dictionary: dict) -> float:
+    return saturation_pressure.extrapolation(
+        temperature=temperature,
+        file=saturation_pressure_file,
+        adsorbate_name=input_dictionary[0]['ADSORBATE'])
+
+
+def _saturation_pressure_polynomial_water(temperature: float, properties_dictionary: dict,
+                                          saturation_pressure_file: str, input_dictionary: dict) -> float:
+    return saturation_pressure.polynomial_water(temperature=temperature)
+
+
+def _saturation_pressure_peng_robinson(temperature: float, properties_dictionary: dict, saturation_pressure_file: str,
+                                       input_dictionary: dict) -> float:
+    return saturation_pressure.pengrobinson(
+        temperature=temperature,
+        temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
+        pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
+        pressure_guess=1,
+        acentric_factor=properties_dictionary['ACENTRIC_FACTOR'])
+
+
+def _saturation_pressure_equation_extrapolation(temperature: float, properties_dictionary: dict,
+                                                equation: str) -> float:
+    return saturation_pressure.equation_extrapolation(
+        temperature=temperature,
+        temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
+        pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
+        acentric_factor=properties_dictionary['ACENTRIC_FACTOR'],
+        temperature_boiling=properties_dictionary['TEMPERATURE_BOILING'],
+        equation=equation,
+        kappa1=properties_dictionary['PRSV_KAPPA1'],
+        kappa2=properties_dictionary['PRSV_KAPPA2'],
+        kappa3=properties_dictionary['PRSV_KAPPA3'],
+        function="polynomial2")
+
+
+def _saturation_pressure_preos_extrapolation(temperature: float, properties_dictionary: dict,
+                                             saturation_pressure_file: str, input_dictionary: dict) -> float:
+    return _saturation_pressure_equation_extrapolation(temperature, properties_dictionary, equation="preos")
+
+
+def _saturation_pressure_prsv1_extrapolation(temperature: float, properties_dictionary: dict,
+                                             saturation_pressure_file: str, input_dictionary: dict) -> float:
+    return _saturation_pressure_equation_extrapolation(temperature, properties_dictionary, equation="prsv1")
+
+
+def _saturation_pressure_prsv2_extrapolation(temperature: float, properties_dictionary: dict,
+                                             saturation_pressure_file: str, input_dictionary: dict) -> float:
+    return _saturation_pressure_equation_extrapolation(temperature, properties_dictionary, equation="prsv2")
+
+
+def _saturation_pressure_widom_banuti(temperature: float, properties_dictionary: dict, saturation_pressure_file: str,
+                                      input_dictionary: dict) -> float:
+    return saturation_pressure.widombanuti(
+        temperature=temperature,
+        temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
+        pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
+        species_parameter=5.589,
+        acentric_factor=properties_dictionary['ACENTRIC_FACTOR'])
+
+
+def _saturation_pressure_isochore(temperature: float, properties_dictionary: dict, saturation_pressure_file: str,
+                                  input_dictionary: dict) -> float:
+    return saturation_pressure.critical_isochore_model(
+        temperature=temperature,
+        temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
+        pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
+        acentric_factor=properties_dictionary['ACENTRIC_FACTOR'])
+
+
+SATURATION_PRESSURE_METHODS = {
+    "dubinin": _saturation_pressure_dubinin,
+    "amankwah": _saturation_pressure_amankwah,
+    "extrapolation": _saturation_pressure_extrapolation,
+    "polynomial_water": _saturation_pressure_polynomial_water,
+    "peng_robinson": _saturation_pressure_peng_robinson,
+    "peng_robinson_extrapolation": _saturation_pressure_preos_extrapolation,
+    "prsv1_extrapolation": _saturation_pressure_prsv1_extrapolation,
+    "prsv2_extrapolation": _saturation_pressure_prsv2_extrapolation,
+    "widom_banuti": _saturation_pressure_widom_banuti,
+    "critical_isochore": _saturation_pressure_isochore
+}
+
+# Methods given by closed-form expressions, at least above the critical temperature, which can be evaluated for a whole
+# array of temperatures in a single call
+VECTORIZED_SATURATION_PRESSURE_METHODS = frozenset({"dubinin", "amankwah", "extrapolation", "polynomial_water",
+                                                    "widom_banuti", "critical_isochore"})
+
+
+def get_density_function(method: str):
+    """
+    Select the function computing the adsorbate density with the given method. Resolving the method once allows the
+    callers that evaluate the density many times to skip the lookup on every evaluation.
+
+    :param method: Method used to compute the density, one of the keys of DENSITY_METHODS.
+    :return: Function taking the temperature, the properties dictionary and the input dictionary.
+    """
+    density_function = DENSITY_METHODS.get(method)
+    if density_function is None:
+        logger.error(f"{method} is not a valid adsorbate density computation method.")
+        raise ValueError(f"{method} is not a valid adsorbate density computation method."
+                         f" Change the method or check for spelling errors!")
+
+    return density_function
+
+
+def get_saturation_pressure_function(method: str):
+    """
+    Select the function computing the adsorbate saturation pressure with the given method.
+
+    :param method: Method used to compute the saturation pressure, one of the keys of SATURATION_PRESSURE_METHODS.
+    :return: Function taking the temperature, the properties dictionary, the saturation pressure file and the input
+    dictionary.
+    """
+    saturation_pressure_function = SATURATION_PRESSURE_METHODS.get(method)
+    if saturation_pressure_function is None:
+        logger.error(f"{method} is not a valid adsorbate saturation pressure computation method.")
+        raise ValueError(f"{method} is not a valid adsorbate saturation "
+                         f"pressure computation method. Change the method or check for spelling errors!")
+
+    return saturation_pressure_function
+
 
 def compute_density_from_method(method: str, temperature: float, properties_dictionary: dict,
                                 input_dictionary: dict) -> float:
     """
     Compute the adsorbate density using the method specified in the input file and the respective molecular properties
-    and environmental conditions.
+    and environmental conditions. The supported methods are the keys of DENSITY_METHODS.
 
     :param method: Name of the method used to compute the adsorbate density.
-    :param temperature: Temperature at which the adsorbate density is computed in K.
+    :param temperature: Temperature at which the adsorbate density is computed in K, either a float or a numpy array.
     :param properties_dictionary: Dictionary containing the properties of the molecule used.
     :param input_dictionary: Dictionary containing the arguments found in the input file.
-    :return: Adsorbate density in kg/m3.
+    :return: Adsorbate density in kg/m3, with the same shape as the temperature.
     """
 
     logger.info(f"Computing density at {temperature} K using method {method}.")
 
-    def density_empirical() -> float:
-        return density.empirical(
-            pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
-            temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
-
-    def density_hauer() -> float:
-        return density.hauer(
-            temperature=temperature,
-            temperature_boiling=properties_dictionary['TEMPERATURE_BOILING'],
-            density_boiling=properties_dictionary['DENSITY_BOILING'],
-            thermal_expansion_coefficient=input_dictionary[0]['THERMAL_EXPANSION_COEFFICIENT'])
-
-    def density_ozawa() -> float:
-        return density.ozawa(
-            temperature=temperature,
-            temperature_boiling=properties_dictionary['TEMPERATURE_BOILING'],
-            density_boiling=properties_dictionary['DENSITY_BOILING'],
-            thermal_expansion_coefficient=input_dictionary[0]['THERMAL_EXPANSION_COEFFICIENT'])
-
-    def density_extrapolation() -> float:
-        return density.extrapolation(
-            temperature=temperature,
-            file=input_dictionary[0]['DENSITY_FILE'],
-            adsorbate_name=input_dictionary[0]['ADSORBATE'])
-
-    density_methods = {
-        "empirical": density_empirical,
-        "hauer": density_hauer,
-        "ozawa": density_ozawa,
-        "extrapolation": density_extrapolation
-    }
-
-    if method in density_methods.keys():
-        adsorbate_density = density_methods[method]()
-        logger.info(f"Obtained density {adsorbate_density} kg/m3.")
-    else:
-        logger.error(f"{method} is not a valid adsorbate density computation method.")
-        raise ValueError(f"{method} is not a valid adsorbate density computation method."
-                         f" Change the method or check for spelling errors!")
+    adsorbate_density = get_density_function(method)(temperature, properties_dictionary, input_dictionary)
+    logger.info(f"Obtained density {adsorbate_density} kg/m3.")
 
     return adsorbate_density
 
@@ -86,7 +285,7 @@ def compute_saturation_pressure_from_method(method: str, temperature: float, pro
                                             saturation_pressure_file: str, input_dictionary: dict) -> float:
     """
     Compute the adsorbate saturation pressure using the method specified in the input file and the respective molecular
-    properties and environmental conditions.
+    properties and environmental conditions. The supported methods are the keys of SATURATION_PRESSURE_METHODS.
 
     :param method: Name of the method used to compute the adsorbate saturation pressure.
     :param temperature: Temperature at which the adsorbate saturation pressure is computed in K.
@@ -98,114 +297,47 @@ def compute_saturation_pressure_from_method(method: str, temperature: float, pro
 
     logger.info(f"Computing saturation pressure at {temperature} K using method {method}.")
 
-    def saturation_pressure_dubinin() -> float:
-        return saturation_pressure.dubinin(
-            temperature=temperature,
-            temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
-            pressure_critical=properties_dictionary['PRESSURE_CRITICAL'])
-
-    def saturation_pressure_amankwah() -> float:
-        return saturation_pressure.amankwah(
-            temperature=temperature,
-            temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
-            pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
-            k=input_dictionary[0]['AMANKWAH_EXPONENT'])
-
-    def saturation_pressure_extrapolation() -> float:
-        return saturation_pressure.extrapolation(
-            temperature=temperature,
-            file=saturation_pressure_file,
-            adsorbate_name=input_dictionary[0]['ADSORBATE'])
-
-    def saturation_pressure_polynomial_water() -> float:
-        return saturation_pressure.polynomial_water(temperature=temperature)
-
-    def saturation_pressure_peng_robinson() -> float:
-        return saturation_pressure.pengrobinson(
-            temperature=temperature,
-            temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
-            pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
-            pressure_guess=1,
-            acentric_factor=properties_dictionary['ACENTRIC_FACTOR'])
-
-    def saturation_pressure_preos_extrapolation() -> float:
-        return saturation_pressure.equation_extrapolation(
-            temperature=temperature,
-            temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
-            pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
-            acentric_factor=properties_dictionary['ACENTRIC_FACTOR'],
-            temperature_boiling=properties_dictionary['TEMPERATURE_BOILING'],
-            equation="preos",
-            kappa1=properties_dictionary['PRSV_KAPPA1'],
-            kappa2=properties_dictionary['PRSV_KAPPA2'],
-            kappa3=properties_dictionary['PRSV_KAPPA3'],
-            function="polynomial2")
-
-    def saturation_pressure_prsv1_extrapolation() -> float:
-        return saturation_pressure.equation_extrapolation(
-            temperature=temperature,
-            temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
-            pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
-            acentric_factor=properties_dictionary['ACENTRIC_FACTOR'],
-            temperature_boiling=properties_dictionary['TEMPERATURE_BOILING'],
-            equation="prsv1",
-            kappa1=properties_dictionary['PRSV_KAPPA1'],
-            kappa2=properties_dictionary['PRSV_KAPPA2'],
-            kappa3=properties_dictionary['PRSV_KAPPA3'],
-            function="polynomial2")
-
-    def saturation_pressure_prsv2_extrapolation() -> float:
-        return saturation_pressure.equation_extrapolation(
-            temperature=temperature,
-            temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
-            pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
-            acentric_factor=properties_dictionary['ACENTRIC_FACTOR'],
-            temperature_boiling=properties_dictionary['TEMPERATURE_BOILING'],
-            equation="prsv2",
-            kappa1=properties_dictionary['PRSV_KAPPA1'],
-            kappa2=properties_dictionary['PRSV_KAPPA2'],
-            kappa3=properties_dictionary['PRSV_KAPPA3'],
-            function="polynomial2")
-
-    def saturation_pressure_widom_banuti() -> float:
-        return saturation_pressure.widombanuti(
-            temperature=temperature,
-            temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
-            pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
-            species_parameter=5.589,
-            acentric_factor=properties_dictionary['ACENTRIC_FACTOR'])
-
-    def saturation_pressure_isochore() -> float:
-        return saturation_pressure.critical_isochore_model(
-            temperature=temperature,
-            temperature_critical=properties_dictionary['TEMPERATURE_CRITICAL'],
-            pressure_critical=properties_dictionary['PRESSURE_CRITICAL'],
-            acentric_factor=properties_dictionary['ACENTRIC_FACTOR'])
-
-    saturation_pressure_methods = {
-        "dubinin": saturation_pressure_dubinin,
-        "amankwah": saturation_pressure_amankwah,
-        "extrapolation": saturation_pressure_extrapolation,
-        "polynomial_water": saturation_pressure_polynomial_water,
-        "peng_robinson": saturation_pressure_peng_robinson,
-        "peng_robinson_extrapolation": saturation_pressure_preos_extrapolation,
-        "prsv1_extrapolation": saturation_pressure_prsv1_extrapolation,
-        "prsv2_extrapolation": saturation_pressure_prsv2_extrapolation,
-        "widom_banuti": saturation_pressure_widom_banuti,
-        "critical_isochore": saturation_pressure_isochore
-    }
-
-    if method in saturation_pressure_methods.keys():
-        adsorbate_saturation_pressure = saturation_pressure_methods[method]()
-        logger.info(f"Obtained saturation pressure {adsorbate_saturation_pressure} MPa.")
-    else:
-        logger.error(f"{method} is not a valid adsorbate saturation pressure computation method.")
-        raise ValueError(f"{method} is not a valid adsorbate saturation "
-                         f"pressure computation method. Change the method or check for spelling errors!")
+    adsorbate_saturation_pressure = get_saturation_pressure_function(method)(
+        temperature, properties_dictionary, saturation_pressure_file, input_dictionary)
+    logger.info(f"Obtained saturation pressure {adsorbate_saturation_pressure} MPa.")
 
     return adsorbate_saturation_pressure
 
 
+def compute_saturation_pressure_array(method: str, temperatures: numpy.ndarray, properties_dictionary: dict,
+                                      saturation_pressure_file: str, input_dictionary: dict) -> numpy.ndarray:
+    """
+    Compute the adsorbate saturation pressure for an array of temperatures. Methods from
+    VECTORIZED_SATURATION_PRESSURE_METHODS are evaluated for all temperatures at once, while the methods that rely on a
+    solver are evaluated for each temperature separately.
+
+    :param method: Name of the method used to compute the adsorbate saturation pressure.
+    :param temperatures: Temperatures at which the adsorbate saturation pressure is computed in K.
+    :param properties_dictionary: Dictionary containing the properties of the molecule used.
+    :param saturation_pressure_file: Path to the file containing saturation pressure data.
+    :param input_dictionary: Dictionary containing the arguments found in the input file.
+    :return: Array of adsorbate saturation pressures in MPa.
+    """
+
+    temperatures = numpy.asarray(temperatures, dtype=float)
+
+    if method in VECTORIZED_SATURATION_PRESSURE_METHODS:
+        saturation_pressures = compute_saturation_pressure_from_method(
+            method=method,
+            temperature=temperatures,
+            properties_dictionary=properties_dictionary,
+            saturation_pressure_file=saturation_pressure_file,
+            input_dictionary=input_dictionary)
+        return numpy.broadcast_to(saturation_pressures, temperatures.shape).astype(float)
+
+    return numpy.array([compute_saturation_pressure_from_method(
+        method=method,
+        temperature=temperature,
+        properties_dictionary=properties_dictionary,
+        saturation_pressure_file=saturation_pressure_file,
+        input_dictionary=input_dictionary) for temperature in temperatures], dtype=float)
+
+
 def read_data(source_dictionary: dict, properties_dictionary: dict, input_dictionary: dict) -> None:
     """
     Read adsorption data from the provided files.
@@ -675,24 +807,17 @@ def compute_characteristic(source_dictionary: dict, input_dictionary: dict, prop
             adsorbate_density=source_dictionary[index]['density'])
 
     def from_isobar(index):
-        saturation_pressure_array = []
-        density_array = []
-        for temperature in source_dictionary[index]['temperature']:
-            saturation_pressure_array.append(compute_saturation_pressure_from_method(
-                method=input_dictionary[index]['ADSORBATE_SATURATION_PRESSURE'],
-                temperature=temperature,
-                properties_dictionary=properties_dictionary,
-                saturation_pressure_file=input_dictionary[index]['SATURATION_PRESSURE_FILE'],
-                input_dictionary=input_dictionary))
-
-            density_array.append(compute_density_from_method(
-                method=input_dictionary[index]['ADSORBATE_DENSITY'],
-                temperature=temperature,
-                properties_dictionary=properties_dictionary,
-                input_dictionary=input_dictionary))
-
-        source_dictionary[index]['saturation_pressure'] = numpy.array(saturation_pressure_array)
-        source_dictionary[index]['density'] = numpy.array(density_array)
+        source_dictionary[index]['saturation_pressure'] = compute_saturation_pressure_array(
+            method=input_dictionary[index]['ADSORBATE_SATURATION_PRESSURE'],
+            temperatures=source_dictionary[index]['temperature'],
+            properties_dictionary=properties_dictionary,
+            saturation_pressure_file=input_dictionary[index]['SATURATION_PRESSURE_FILE'],
+            input_dictionary=input_dictionary)
+        source_dictionary[index]['density'] = compute_density_from_method(
+            method=input_dictionary[index]['ADSORBATE_DENSITY'],
+            temperature=source_dictionary[index]['temperature'],
+            properties_dictionary=properties_dictionary,
+            input_dictionary=input_dictionary)
 
         source_dictionary[index]['potential'] = physics.get_adsorption_potential(
             temperature=source_dictionary[index]['temperature'],
@@ -764,17 +889,15 @@ def compute_saturation_pressure_curve(input_dictionary: dict, properties_diction
     logger.info(f"Found temperature interval {start_temperature}K - {end_temperature}K with {num} points in between.")
 
     temperatures = numpy.linspace(start_temperature, end_temperature, num)
-    saturation_pressures = numpy.zeros(num)
-    logger.info(f"Successfully generated temperature interval and saturation pressure variable.")
+    logger.info(f"Successfully generated temperature interval.")
 
-    for index, temperature in enumerate(temperatures):
-        saturation_pressures[index] = compute_saturation_pressure_from_method(
-            method=input_dictionary[0]['ADSORBATE_SATURATION_PRESSURE'],
-            temperature=temperature,
-            properties_dictionary=properties_dictionary,
-            saturation_pressure_file=input_dictionary[0]['SATURATION_PRESSURE_FILE'],
-            input_dictionary=input_dictionary)
-        logger.info(f"For temperature {temperature}K got saturation pressure {saturation_pressures[index]} MPa.")
+    saturation_pressures = compute_saturation_pressure_array(
+        method=input_dictionary[0]['ADSORBATE_SATURATION_PRESSURE'],
+        temperatures=temperatures,
+        properties_dictionary=properties_dictionary,
+        saturation_pressure_file=input_dictionary[0]['SATURATION_PRESSURE_FILE'],
+        input_dictionary=input_dictionary)
+    logger.info(f"For temperatures {temperatures}K got saturation pressures {saturation_pressures} MPa.")
 
     molecule = input_dictionary[0]['ADSORBATE']
 
@@ -820,16 +943,14 @@ def compute_density_curve(input_dictionary: dict, properties_dictionary: dict):
     logger.info(f"Found temperature interval {start_temperature}K - {end_temperature}K with {num} points in between.")
 
     temperatures = numpy.linspace(start_temperature, end_temperature, num)
-    densities = numpy.zeros(num)
-    logger.info(f"Successfully generated temperature interval and saturation pressure variable.")
+    logger.info(f"Successfully generated temperature interval.")
 
-    for index, temperature in enumerate(temperatures):
-        densities[index] = compute_density_from_method(
-            method=input_dictionary[0]['ADSORBATE_DENSITY'],
-            temperature=temperature,
-            properties_dictionary=properties_dictionary,
-            input_dictionary=input_dictionary)
-        logger.info(f"For temperature {temperature}K got density {densities[index]} kg/m3.")
+    # All density methods accept temperature arrays, so the whole curve is computed in a single call
+    densities = compute_density_from_method(
+        method=input_dictionary[0]['ADSORBATE_DENSITY'],
+        temperature=temperatures,
+        properties_dictionary=properties_dictionary,
+        input_dictionary=input_dictionary)
 
     molecule = input_dictionary[0]['ADSORBATE']
 
@@ -862,210 +983,234 @@ def compute_density_curve(input_dictionary: dict, properties_dictionary: dict):
     logger.info(f"Finished writing to file Output/{file_name}.")
 
 
-def plot_data(source_dictionary: dict, input_dictionary: dict, properties_dictionary: dict, plot_format: str,
-              save: str, from_input: bool) -> None:
-    """
-    Create plot based on the input data type. Supports between isotherm, isobar, and characteristic curve.
+def _plot_isotherm(source_dictionary: dict, index: int, input_dictionary: dict,
+                   properties_dictionary: dict) -> None:
+    unit_temperature = input_dictionary[0]['OUTPUT_TEMPERATURE_UNITS']
+    unit_pressure = input_dictionary[0]['OUTPUT_PRESSURE_UNITS']
+    unit_loading = input_dictionary[0]['OUTPUT_LOADING_UNITS']
 
-    :param source_dictionary: Dictionary containing the source data for the plotting.
-    :param input_dictionary: Dictionary containing the arguments found in the input file.
-    :param plot_format: Format of the plot, given by the source data format. Can be isobar, isotherm or characteristic
-    curve.
-    :param save: Dictates if the plot is saved. Saved if "yes", otherwise do not save.
-    :param from_input: Dictates if the data comes from the input files, and sets a separate name for the plot.
-    """
+    cf_temperature = convert_output(
+        unit_temperature,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-    logger.info(f"Starting plotting procedure.")
+    cf_pressure = convert_output(
+        unit_pressure,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-    def plot_isotherm(index):
+    cf_loading = convert_output(
+        unit_loading,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-        unit_temperature = input_dictionary[0]['OUTPUT_TEMPERATURE_UNITS']
-        unit_pressure = input_dictionary[0]['OUTPUT_PRESSURE_UNITS']
-        unit_loading = input_dictionary[0]['OUTPUT_LOADING_UNITS']
+    temperature = source_dictionary[index]['temperature'] * cf_temperature
+    pressure = source_dictionary[index]['pressure'] * cf_pressure
+    loading = source_dictionary[index]['loading'] * cf_loading
 
-        cf_temperature = convert_output(
-            unit_temperature,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
+    label = f"{temperature:.2f}{unit_temperature}"
+    plt.scatter(pressure, loading, label=label)
+    plt.xlabel(f"Pressure [{unit_pressure}]")
+    plt.ylabel(f"Adsorbed amount [{unit_loading}]")
 
-        cf_pressure = convert_output(
-            unit_pressure,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-        cf_loading = convert_output(
-            unit_loading,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
+def _plot_isobar(source_dictionary: dict, index: int, input_dictionary: dict,
+                 properties_dictionary: dict) -> None:
+    unit_temperature = input_dictionary[0]['OUTPUT_TEMPERATURE_UNITS']
+    unit_pressure = input_dictionary[0]['OUTPUT_PRESSURE_UNITS']
+    unit_loading = input_dictionary[0]['OUTPUT_LOADING_UNITS']
 
-        temperature = source_dictionary[index]['temperature'] * cf_temperature
-        pressure = source_dictionary[index]['pressure'] * cf_pressure
-        loading = source_dictionary[index]['loading'] * cf_loading
+    cf_temperature = convert_output(
+        unit_temperature,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-        label = f"{temperature:.2f}{unit_temperature}"
-        plt.scatter(pressure, loading, label=label)
-        plt.xlabel(f"Pressure [{unit_pressure}]")
-        plt.ylabel(f"Adsorbed amount [{unit_loading}]")
+    cf_pressure = convert_output(
+        unit_pressure,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-    def plot_isobar(index):
+    cf_loading = convert_output(
+        unit_loading,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-        unit_temperature = input_dictionary[0]['OUTPUT_TEMPERATURE_UNITS']
-        unit_pressure = input_dictionary[0]['OUTPUT_PRESSURE_UNITS']
-        unit_loading = input_dictionary[0]['OUTPUT_LOADING_UNITS']
+    temperature = source_dictionary[index]['temperature'] * cf_temperature
+    pressure = source_dictionary[index]['pressure'] * cf_pressure
+    loading = source_dictionary[index]['loading'] * cf_loading
 
-        cf_temperature = convert_output(
-            unit_temperature,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
+    label = f"{pressure:.2f} {unit_pressure}"
+    plt.scatter(temperature, loading, label=label)
+    plt.xlabel(f"Temperature [{unit_temperature}]")
+    plt.ylabel(f"Adsorbed amount [{unit_loading}]")
 
-        cf_pressure = convert_output(
-            unit_pressure,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-        cf_loading = convert_output(
-            unit_loading,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
+def _plot_isostere(source_dictionary: dict, index: int, input_dictionary: dict,
+                   properties_dictionary: dict) -> None:
+    unit_temperature = input_dictionary[0]['OUTPUT_TEMPERATURE_UNITS']
+    unit_pressure = input_dictionary[0]['OUTPUT_PRESSURE_UNITS']
+    unit_loading = input_dictionary[0]['OUTPUT_LOADING_UNITS']
 
-        temperature = source_dictionary[index]['temperature'] * cf_temperature
-        pressure = source_dictionary[index]['pressure'] * cf_pressure
-        loading = source_dictionary[index]['loading'] * cf_loading
+    cf_temperature = convert_output(
+        unit_temperature,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-        label = f"{pressure:.2f} {unit_pressure}"
-        plt.scatter(temperature, loading, label=label)
-        plt.xlabel(f"Temperature [{unit_temperature}]")
-        plt.ylabel(f"Adsorbed amount [{unit_loading}]")
+    cf_pressure = convert_output(
+        unit_pressure,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-    def plot_isostere(index):
+    cf_loading = convert_output(
+        unit_loading,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-        unit_temperature = input_dictionary[0]['OUTPUT_TEMPERATURE_UNITS']
-        unit_pressure = input_dictionary[0]['OUTPUT_PRESSURE_UNITS']
-        unit_loading = input_dictionary[0]['OUTPUT_LOADING_UNITS']
+    temperature = source_dictionary[index]['temperature'] * cf_temperature
+    pressure = source_dictionary[index]['pressure'] * cf_pressure
+    loading = source_dictionary[index]['loading'] * cf_loading
 
-        cf_temperature = convert_output(
-            unit_temperature,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
+    label = f"{loading:.2f} {unit_loading}"
+    plt.scatter(temperature, pressure, label=label)
+    plt.xlabel(f"Temperature [{unit_temperature}]")
+    plt.ylabel(f"Pressure [{unit_pressure}]")
 
-        cf_pressure = convert_output(
-            unit_pressure,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-        cf_loading = convert_output(
-            unit_loading,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
+def _plot_enthalpy(source_dictionary: dict, index: int, input_dictionary: dict,
+                   properties_dictionary: dict) -> None:
+    unit_loading = input_dictionary[0]['OUTPUT_LOADING_UNITS']
 
-        temperature = source_dictionary[index]['temperature'] * cf_temperature
-        pressure = source_dictionary[index]['pressure'] * cf_pressure
-        loading = source_dictionary[index]['loading'] * cf_loading
+    cf_loading = convert_output(
+        unit_loading,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-        label = f"{loading:.2f} {unit_loading}"
-        plt.scatter(temperature, pressure, label=label)
-        plt.xlabel(f"Temperature [{unit_temperature}]")
-        plt.ylabel(f"Pressure [{unit_pressure}]")
+    loading = source_dictionary['loading'] * cf_loading
+    enthalpy = source_dictionary['enthalpy']
 
-    def plot_enthalpy(index):
+    plt.scatter(loading, enthalpy)
+    plt.xlabel(f"Loading [{unit_loading}]")
+    plt.ylabel(f"Enthalpy of adsorption [kJ/mol]")
 
-        unit_loading = input_dictionary[0]['OUTPUT_LOADING_UNITS']
 
-        cf_loading = convert_output(
-            unit_loading,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
+def _plot_characteristic(source_dictionary: dict, index: int, input_dictionary: dict,
+                         properties_dictionary: dict) -> None:
+    unit_temperature = input_dictionary[0]['OUTPUT_TEMPERATURE_UNITS']
+    unit_pressure = input_dictionary[0]['OUTPUT_PRESSURE_UNITS']
+    unit_potential = input_dictionary[0]['OUTPUT_POTENTIAL_UNITS']
+    unit_volume = input_dictionary[0]['OUTPUT_VOLUME_UNITS']
 
-        loading = source_dictionary['loading'] * cf_loading
-        enthalpy = source_dictionary['enthalpy']
+    cf_temperature = convert_output(
+        unit_temperature,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-        plt.scatter(loading, enthalpy)
-        plt.xlabel(f"Loading [{unit_loading}]")
-        plt.ylabel(f"Enthalpy of adsorption [kJ/mol]")
+    cf_pressure = convert_output(
+        unit_pressure,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-    def plot_characteristic(index):
+    cf_potential = convert_output(
+        unit_potential,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-        unit_temperature = input_dictionary[0]['OUTPUT_TEMPERATURE_UNITS']
-        unit_pressure = input_dictionary[0]['OUTPUT_PRESSURE_UNITS']
-        unit_potential = input_dictionary[0]['OUTPUT_POTENTIAL_UNITS']
-        unit_volume = input_dictionary[0]['OUTPUT_VOLUME_UNITS']
+    cf_volume = convert_output(
+        unit_volume,
+        molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-        cf_temperature = convert_output(
-            unit_temperature,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
+    temperature = source_dictionary[index]['temperature'] * cf_temperature
+    pressure = source_dictionary[index]['pressure'] * cf_pressure
+    potential = source_dictionary[index]['potential'] * cf_potential
+    volume = source_dictionary[index]['volume'] * cf_volume
 
-        cf_pressure = convert_output(
-            unit_pressure,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
+    if not isinstance(source_dictionary[index]['temperature'], numpy.ndarray):
+        label = f"{temperature:.2f}{unit_temperature}"
+    else:
+        label = f"{pressure:.2f} {unit_pressure}"
 
-        cf_potential = convert_output(
-            unit_potential,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
+    plt.scatter(potential, volume, label=label)
+    plt.xlabel(f"Adsorption potential [{unit_potential}]")
+    plt.ylabel(f"Adsorption volume [{unit_volume}]")
+
+
+PLOT_FORMATS = {
+    "isotherm": _plot_isotherm,
+    "isobar": _plot_isobar,
+    "isostere": _plot_isostere,
+    "enthalpy": _plot_enthalpy,
+    "characteristic": _plot_characteristic,
+    "langmuir": _plot_isotherm,
+    "n-langmuir": _plot_isotherm,
+    "bet": _plot_isotherm,
+    "anti-langmuir": _plot_isotherm,
+    "henry": _plot_isotherm,
+    "freundlich": _plot_isotherm,
+    "sips": _plot_isotherm,
+    "n-sips": _plot_isotherm,
+    "langmuir-freundlich": _plot_isotherm,
+    "n-langmuir-freundlich": _plot_isotherm,
+    "redlich-peterson": _plot_isotherm,
+    "toth": _plot_isotherm,
+    "unilan": _plot_isotherm,
+    "obrien-myers": _plot_isotherm,
+    "quadratic": _plot_isotherm,
+    "asymptotic-temkin": _plot_isotherm,
+    "bingel-walton": _plot_isotherm
+}
 
-        cf_volume = convert_output(
-            unit_volume,
-            molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-        temperature = source_dictionary[index]['temperature'] * cf_temperature
-        pressure = source_dictionary[index]['pressure'] * cf_pressure
-        potential = source_dictionary[index]['potential'] * cf_potential
-        volume = source_dictionary[index]['volume'] * cf_volume
+def plot_data(source_dictionary: dict, input_dictionary: dict, properties_dictionary: dict, plot_format: str,
+              save: str, from_input: bool) -> None:
+    """
+    Create plot based on the input data type. Supports between isotherm, isobar, and characteristic curve.
 
-        if type(source_dictionary[index]['temperature']) is not numpy.ndarray:
-            label = f"{temperature:.2f}{unit_temperature}"
-        else:
-            label = f"{pressure:2.f} {unit_pressure}"
-
-        plt.scatter(potential, volume, label=label)
-        plt.xlabel(f"Adsorption potential [{unit_potential}]")
-        plt.ylabel(f"Adsorption volume [{unit_volume}]")
-
-    plot_formats = {
-        "isotherm": plot_isotherm,
-        "isobar": plot_isobar,
-        "isostere": plot_isostere,
-        "enthalpy": plot_enthalpy,
-        "characteristic": plot_characteristic,
-        "langmuir": plot_isotherm,
-        "n-langmuir": plot_isotherm,
-        "bet": plot_isotherm,
-        "anti-langmuir": plot_isotherm,
-        "henry": plot_isotherm,
-        "freundlich": plot_isotherm,
-        "sips": plot_isotherm,
-        "n-sips": plot_isotherm,
-        "langmuir-freundlich": plot_isotherm,
-        "n-langmuir-freundlich": plot_isotherm,
-        "redlich-peterson": plot_isotherm,
-        "toth": plot_isotherm,
-        "unilan": plot_isotherm,
-        "obrien-myers": plot_isotherm,
-        "quadratic": plot_isotherm,
-        "asymptotic-temkin": plot_isotherm,
-        "bingel-walton": plot_isotherm
-    }
+    :param source_dictionary: Dictionary containing the source data for the plotting.
+    :param input_dictionary: Dictionary containing the arguments found in the input file.
+    :param plot_format: Format of the plot, given by the source data format. Can be isobar, isotherm or characteristic
+    curve.
+    :param save: Dictates if the plot is saved. Saved if "yes", otherwise do not save.
+    :param from_input: Dictates if the data comes from the input files, and sets a separate name for the plot.
+    """
 
-    plt.figure(figsize=(7, 6))
-    plt.rc('axes', labelsize="xx-large")
-    plt.rc('xtick', labelsize="xx-large")
-    plt.rc('ytick', labelsize="xx-large")
-    plt.rc('legend', fontsize="x-large")
+    logger.info(f"Starting plotting procedure.")
 
-    for index in source_dictionary:
-        if plot_format in plot_formats:
+    plot_function = PLOT_FORMATS.get(plot_format)
+    if plot_function is None:
+        logger.error(f"{plot_format} is not a valid data type for plotting!")
+        raise ValueError(f"{plot_format} is not a valid data type for plotting!")
+
+    with plt.rc_context(PLOT_STYLE):
+        figure = plt.figure(figsize=FIGURE_SIZE)
+
+        for index in source_dictionary:
             logger.info(f"Attempting to plot {plot_format} {index}.")
-            plot_formats[plot_format](index)
+            plot_function(source_dictionary, index, input_dictionary, properties_dictionary)
             logger.info(f"Finished plotting {plot_format} {index}.")
-        else:
-            logger.error(f"{plot_format} at index {index} is not a valid data type for plotting!")
-            raise ValueError(f"{plot_format} at index {index} is not a valid data type for plotting!")
 
-    if plot_format == "isotherm" and input_dictionary[0]['LOGARITHMIC_PLOT'] == "yes":
-        plt.xscale('log')
+        if plot_format == "isotherm" and input_dictionary[0]['LOGARITHMIC_PLOT'] == "yes":
+            plt.xscale('log')
 
-    plt.legend()
-    plt.tight_layout()
+        plt.legend()
+        plt.tight_layout()
 
-    if save.lower() == "yes":
-        os.makedirs(name="Plots", exist_ok=True)
+        if save.lower() == "yes":
+            os.makedirs(name="Plots", exist_ok=True)
 
-        if from_input is True:
-            figure_name = f"{input_dictionary[0]['ADSORBATE']}_in_{input_dictionary[0]['ADSORBENT']}_input"
-        else:
-            figure_name = f"{input_dictionary[0]['ADSORBATE']}_in_{input_dictionary[0]['ADSORBENT']}_{plot_format}"
+            if from_input is True:
+                figure_name = f"{input_dictionary[0]['ADSORBATE']}_in_{input_dictionary[0]['ADSORBENT']}_input"
+            else:
+                figure_name = (f"{input_dictionary[0]['ADSORBATE']}_in_{input_dictionary[0]['ADSORBENT']}_"
+                               f"{plot_format}")
 
-        plt.savefig(f"Plots/{figure_name}.png")
-        logger.info(f"Successfully saved plot at Plots/{figure_name}.png.")
+            plt.savefig(f"Plots/{figure_name}.png")
+            logger.info(f"Successfully saved plot at Plots/{figure_name}.png.")
+
+    # Figures are only kept open when they are shown at the end of the run, otherwise they accumulate in memory
+    if input_dictionary[0]['SHOW_PLOTS'].lower() != "yes":
+        plt.close(figure)
+
+
+def _format_columns(first_column: numpy.ndarray, second_column: numpy.ndarray, decimals: int) -> str:
+    """
+    Format two columns of data as the rows of an output file, rounding the values to the given number of decimals.
+
+    :param first_column: Values of the first column.
+    :param second_column: Values of the second column.
+    :param decimals: Number of decimals kept in the output.
+    :return: The rows of the file, joined in a single string.
+    """
+    first_column = numpy.round(numpy.asarray(first_column, dtype=float), decimals=decimals).tolist()
+    second_column = numpy.round(numpy.asarray(second_column, dtype=float), decimals=decimals).tolist()
+    return "".join(f"{str(first).rjust(11)} \t {str(second).rjust(11)} \n"
+                   for first, second in zip(first_column, second_column))
 
 
 def write_data(source_dictionary: dict, properties_dictionary: dict, input_dictionary: dict, write_format: str) -> None:
@@ -1098,14 +1243,8 @@ def write_data(source_dictionary: dict, properties_dictionary: dict, input_dicti
                 unit_loading,
                 molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-            for pressure, loading in zip(source_dictionary[index]['pressure'], source_dictionary[index]['loading']):
-                pressure = numpy.round(pressure * cf_pressure, decimals=decimals)
-                loading = numpy.round(loading * cf_loading, decimals=decimals)
-
-                pressure = str(pressure).rjust(11)
-                loading = str(loading).rjust(11)
-
-                file.write(f"{pressure} \t {loading} \n")
+            file.write(_format_columns(source_dictionary[index]['pressure'] * cf_pressure,
+                                       source_dictionary[index]['loading'] * cf_loading, decimals=decimals))
 
     def write_isobar(index, base_name) -> None:
 
@@ -1123,14 +1262,8 @@ def write_data(source_dictionary: dict, properties_dictionary: dict, input_dicti
                 unit_loading,
                 molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-            for temp, loading in zip(source_dictionary[index]['temperature'], source_dictionary[index]['loading']):
-                temp = numpy.round(temp * cf_temperature, decimals=decimals)
-                loading = numpy.round(loading * cf_loading, decimals=decimals)
-
-                temp = str(temp).rjust(11)
-                loading = str(loading).rjust(11)
-
-                file.write(f"{temp} \t {loading} \n")
+            file.write(_format_columns(source_dictionary[index]['temperature'] * cf_temperature,
+                                       source_dictionary[index]['loading'] * cf_loading, decimals=decimals))
 
 
     def write_isostere(index, base_name) -> None:
@@ -1149,19 +1282,13 @@ def write_data(source_dictionary: dict, properties_dictionary: dict, input_dicti
                 unit_pressure,
                 molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-            for temp, pressure in zip(source_dictionary[index]['temperature'], source_dictionary[index]['pressure']):
-                temp = numpy.round(temp * cf_temperature, decimals=decimals)
-                pressure = numpy.round(pressure * cf_pressure, decimals=decimals)
-
-                temp = str(temp).rjust(11)
-                pressure = str(pressure).rjust(11)
-
-                file.write(f"{temp} \t {pressure} \n")
+            file.write(_format_columns(source_dictionary[index]['temperature'] * cf_temperature,
+                                       source_dictionary[index]['pressure'] * cf_pressure, decimals=decimals))
 
 
     def write_characteristic(index, base_name) -> None:
 
-        if type(source_dictionary[index]['temperature']) is not numpy.ndarray:
+        if not isinstance(source_dictionary[index]['temperature'], numpy.ndarray):
             condition = f"{source_dictionary[index]['temperature']}K"
         else:
             condition = f"{source_dictionary[index]['pressure']}MPa"
@@ -1181,14 +1308,8 @@ def write_data(source_dictionary: dict, properties_dictionary: dict, input_dicti
                 unit_volume,
                 molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-            for potential, volume in zip(source_dictionary[index]['potential'], source_dictionary[index]['volume']):
-                potential = numpy.round(potential * cf_potential, decimals=decimals)
-                volume = numpy.round(volume * cf_volume, decimals=decimals)
-
-                potential = str(potential).rjust(11)
-                volume = str(volume).rjust(11)
-
-                file.write(f"{potential} \t {volume} \n")
+            file.write(_format_columns(source_dictionary[index]['potential'] * cf_potential,
+                                       source_dictionary[index]['volume'] * cf_volume, decimals=decimals))
 
     def write_enthalpy(index, base_name) -> None:
 
@@ -1202,14 +1323,8 @@ def write_data(source_dictionary: dict, properties_dictionary: dict, input_dicti
                 unit_loading,
                 molecular_mass=properties_dictionary['MOLECULAR_MASS'])
 
-            for loading, enthalpy in zip(source_dictionary['loading'], source_dictionary['enthalpy']):
-                loading = numpy.round(loading * cf_loading, decimals=decimals)
-                enthalpy = numpy.round(enthalpy, decimals=decimals)
-
-                loading = str(loading).rjust(11)
-                enthalpy = str(enthalpy).rjust(11)
-
-                file.write(f"{loading} \t {enthalpy} \n")
+            file.write(_format_columns(source_dictionary['loading'] * cf_loading, source_dictionary['enthalpy'],
+                                       decimals=decimals))
 
     file_write_formats = {
         "isotherm": write_isotherm,
@@ -1236,17 +1351,147 @@ def write_data(source_dictionary: dict, properties_dictionary: dict, input_dicti
         "bingel-walton": write_isotherm
     }
 
+    write_function = file_write_formats.get(write_format)
+    if write_function is None:
+        logger.error(f"{write_format} is not a valid data type for writing!")
+        raise ValueError(f"{write_format} is not a valid data type for writing!")
+
     os.makedirs(name="Output", exist_ok=True)
+    base_name = f"{input_dictionary[0]['ADSORBATE']}_in_{input_dictionary[0]['ADSORBENT']}"
 
     for index in source_dictionary:
-        base_name = f"{input_dictionary[0]['ADSORBATE']}_in_{input_dictionary[0]['ADSORBENT']}"
-        if write_format in file_write_formats:
-            logger.info(f"Attempting to write {write_format} {index}.")
-            file_write_formats[write_format](index, base_name)
-            logger.info(f"Finished writing {write_format} {index}.")
-        else:
-            logger.error(f"{write_format} at index {index} is not a valid data type for writing!")
-            raise ValueError(f"{write_format} at index {index} is not a valid data type for writing!")
+        logger.info(f"Attempting to write {write_format} {index}.")
+        write_function(index, base_name)
+        logger.info(f"Finished writing {write_format} {index}.")
+
+
+def _linear_interpolation(x: numpy.ndarray, y: numpy.ndarray):
+    """
+    Create a function that interpolates the data linearly and extrapolates the first and last interval beyond it. This
+    is equivalent to scipy.interpolate.interp1d with fill_value="extrapolate", but the data is sorted only once and the
+    function is evaluated using numpy.interp.
+
+    :param x: The x-coordinates of the data, in any order.
+    :param y: The y-coordinates of the data.
+    :return: Function returning the interpolated y-coordinates at the given x-coordinates.
+    """
+    order = numpy.argsort(x, kind="stable")
+    x = numpy.asarray(x, dtype=float)[order]
+    y = numpy.asarray(y, dtype=float)[order]
+
+    lower_slope = (y[1] - y[0]) / (x[1] - x[0])
+    upper_slope = (y[-1] - y[-2]) / (x[-1] - x[-2])
+
+    def interpolation_function(value):
+        value = numpy.asarray(value, dtype=float)
+        result = numpy.interp(value, x, y)
+        result = numpy.where(value < x[0], y[0] + lower_slope * (value - x[0]), result)
+        return numpy.where(value > x[-1], y[-1] + upper_slope * (value - x[-1]), result)
+
+    return interpolation_function
+
+
+def _cache_per_temperature(function, *arguments):
+    """
+    Wrap a method function, such as the ones of DENSITY_METHODS or SATURATION_PRESSURE_METHODS, so that it is only
+    evaluated once per temperature. The cache lives as long as the returned function, which is created for a single
+    prediction or enthalpy computation.
+
+    :param function: Method function taking the temperature in K followed by the given arguments.
+    :param arguments: Remaining arguments of the method function.
+    :return: Function of the temperature in K, returning the cached result of the method function.
+    """
+    cache = {}
+
+    def cached_function(temperature: float) -> float:
+        # The solvers pass the temperature as an array with a single element
+        temperature = numpy.asarray(temperature).item()
+        if temperature not in cache:
+            cache[temperature] = function(temperature, *arguments)
+        return cache[temperature]
+
+    return cached_function
+
+
+def _refine_temperature(function, lower: float, upper: float, lower_value: float, upper_value: float) -> float:
+    """
+    Refine the temperature at which the function changes sign between the two ends of the interval using Brent's
+    method. A sign change can also be caused by a pole, such as the adsorption volume where a linear density model
+    reaches zero, in which case the function grows instead of vanishing towards the refined point.
+
+    :param function: Function of the temperature in K whose root is searched.
+    :param lower: Lower end of the interval in K.
+    :param upper: Upper end of the interval in K.
+    :param lower_value: Value of the function at the lower end.
+    :param upper_value: Value of the function at the upper end.
+    :return: Temperature in K, or None if the sign change is not a root.
+    """
+    temperature = scipy.optimize.brentq(function, lower, upper)
+    residual = abs(numpy.asarray(function(temperature)).item())
+
+    if residual <= ROOT_TOLERANCE * max(abs(lower_value), abs(upper_value)):
+        return temperature
+
+    logger.info(f"Rejected the sign change between {lower} K and {upper} K, as the function has a pole at "
+                f"{temperature} K instead of a root.")
+    return None
+
+
+def _find_temperature(function, temperature_guess: float = 273) -> float:
+    """
+    Find the temperature closest to the initial guess at which the function changes sign.
+
+    The interval around the guess is widened geometrically until one of its sides brackets a sign change, after which
+    the root is refined using Brent's method. If no sign change is found, or the first sign change is a pole rather
+    than a root, fsolve is used from the same initial guess.
+
+    :param function: Function of the temperature in K whose root is searched.
+    :param temperature_guess: Initial guess of the temperature in K.
+    :return: Temperature in K.
+    """
+    lower = upper = temperature_guess
+    lower_value = upper_value = function(temperature_guess)
+    if lower_value == 0:
+        return temperature_guess
+
+    for _ in range(BRACKET_STEPS):
+        new_lower, new_upper = lower / BRACKET_FACTOR, upper * BRACKET_FACTOR
+        new_lower_value, new_upper_value = function(new_lower), function(new_upper)
+
+        if numpy.sign(new_lower_value) * numpy.sign(lower_value) < 0:
+            temperature = _refine_temperature(function, new_lower, lower, new_lower_value, lower_value)
+            break
+        if numpy.sign(new_upper_value) * numpy.sign(upper_value) < 0:
+            temperature = _refine_temperature(function, upper, new_upper, upper_value, new_upper_value)
+            break
+
+        lower, upper = new_lower, new_upper
+        lower_value, upper_value = new_lower_value, new_upper_value
+    else:
+        temperature = None
+
+    if temperature is not None:
+        return temperature
+
+    logger.info(f"Could not bracket a root around {temperature_guess} K, using fsolve instead.")
+    return scipy.optimize.fsolve(function, x0=temperature_guess)[0]
+
+
+def _get_prediction_interval(prediction_range, boundaries: list) -> tuple:
+    """
+    Select the interval of a prediction. Each end of the range requested in the input file is used if it lies within
+    the boundaries and after the start of the interval, otherwise the respective boundary is used.
+
+    :param prediction_range: Range requested in the input file, or None if no range was given.
+    :param boundaries: Lower and upper boundary of the interval that can be predicted.
+    :return: Start and end of the interval.
+    """
+    if prediction_range is None:
+        return boundaries[0], boundaries[1]
+
+    start = prediction_range[0] if boundaries[0] <= prediction_range[0] <= boundaries[1] else boundaries[0]
+    end = prediction_range[1] if start <= prediction_range[1] <= boundaries[1] else boundaries[1]
+    return start, end
 
 
 def predict_data(data_dictionary: dict, input_dictionary: dict, prediction_type: str,
@@ -1263,14 +1508,21 @@ def predict_data(data_dictionary: dict, input_dictionary: dict, prediction_type:
 
     logger.info(f"Starting predicting procedure.")
 
+    saturation_pressure_method = input_dictionary[0]['ADSORBATE_SATURATION_PRESSURE']
+    saturation_pressure_file = input_dictionary[0]['SATURATION_PRESSURE_FILE']
+    density_method = input_dictionary[0]['ADSORBATE_DENSITY']
+    saturation_pressure_function = get_saturation_pressure_function(saturation_pressure_method)
+    density_function = get_density_function(density_method)
+
+    # The boundary solvers and the predictions evaluate the same temperatures repeatedly, so the saturation pressure
+    # and density are only computed once per temperature during a prediction
+    _get_saturation_pressure = _cache_per_temperature(
+        saturation_pressure_function, properties_dictionary, saturation_pressure_file, input_dictionary)
+    _get_density = _cache_per_temperature(density_function, properties_dictionary, input_dictionary)
+
     def _get_pressure_boundaries(temperature: float, potential: numpy.ndarray) -> list:
         logger.info(f"Computing pressure boundaries procedure.")
-        sat_pres = compute_saturation_pressure_from_method(
-            method=input_dictionary[0]['ADSORBATE_SATURATION_PRESSURE'],
-            temperature=temperature,
-            properties_dictionary=properties_dictionary,
-            saturation_pressure_file=input_dictionary[0]['SATURATION_PRESSURE_FILE'],
-            input_dictionary=input_dictionary)
+        sat_pres = _get_saturation_pressure(temperature)
 
         minimum_pressure = physics.get_pressure(
             adsorption_potential=numpy.max(potential),
@@ -1287,72 +1539,61 @@ def predict_data(data_dictionary: dict, input_dictionary: dict, prediction_type:
 
     def _get_temperature_boundaries(pressure: float, potential: numpy.ndarray) -> list:
         logger.info(f"Computing temperature boundaries procedure.")
+        # The extremes of the data are computed once, instead of on every evaluation of the solvers
+        minimum_potential = numpy.min(potential)
+        maximum_potential = numpy.max(potential)
+
         def minimum_temperature_function(temperature_guess: float) -> float:
-            sat_pres = compute_saturation_pressure_from_method(
-                method=input_dictionary[0]['ADSORBATE_SATURATION_PRESSURE'],
-                temperature=temperature_guess,
-                properties_dictionary=properties_dictionary,
-                saturation_pressure_file=input_dictionary[0]['SATURATION_PRESSURE_FILE'],
-                input_dictionary=input_dictionary)
+            sat_pres = _get_saturation_pressure(temperature_guess)
 
             potential_computed = physics.get_adsorption_potential(
                 temperature=temperature_guess,
                 saturation_pressure=sat_pres,
                 pressure=pressure)
 
-            return numpy.min(potential) - potential_computed
+            return minimum_potential - potential_computed
 
         def maximum_temperature_function(temperature_guess: float) -> float:
-            sat_pres = compute_saturation_pressure_from_method(
-                method=input_dictionary[0]['ADSORBATE_SATURATION_PRESSURE'],
-                temperature=temperature_guess,
-                properties_dictionary=properties_dictionary,
-                saturation_pressure_file=input_dictionary[0]['SATURATION_PRESSURE_FILE'],
-                input_dictionary=input_dictionary)
+            sat_pres = _get_saturation_pressure(temperature_guess)
 
             potential_computed = physics.get_adsorption_potential(
                 temperature=temperature_guess,
                 saturation_pressure=sat_pres,
                 pressure=pressure)
 
-            return numpy.max(potential) - potential_computed
+            return maximum_potential - potential_computed
 
-        minimum_temperature = scipy.optimize.fsolve(minimum_temperature_function, x0=273)[0]
-        maximum_temperature = scipy.optimize.fsolve(maximum_temperature_function, x0=273)[0]
+        minimum_temperature = _find_temperature(minimum_temperature_function)
+        maximum_temperature = _find_temperature(maximum_temperature_function)
 
         logger.info(f"Obtained temperature interval between {minimum_temperature} MPa and {maximum_temperature} MPa.")
         return [minimum_temperature, maximum_temperature]
 
     def _get_isostere_boundaries(loading: float, volume: numpy.ndarray) -> list:
         logger.info(f"Computing isostere boundaries procedure.")
+        minimum_volume = numpy.min(volume)
+        maximum_volume = numpy.max(volume)
+
         def minimum_temperature_function(temperature_guess: float) -> float:
-            ads_dens = compute_density_from_method(
-                method=input_dictionary[0]['ADSORBATE_DENSITY'],
-                temperature=temperature_guess,
-                properties_dictionary=properties_dictionary,
-                input_dictionary=input_dictionary)
+            ads_dens = _get_density(temperature_guess)
 
             volume_computed = physics.get_adsorption_volume(
                 adsorbed_amount=loading,
                 adsorbate_density=ads_dens)
 
-            return numpy.max(volume) - volume_computed
+            return maximum_volume - volume_computed
 
         def maximum_temperature_function(temperature_guess: float) -> float:
-            ads_dens = compute_density_from_method(
-                method=input_dictionary[0]['ADSORBATE_DENSITY'],
-                temperature=temperature_guess,
-                properties_dictionary=properties_dictionary,
-                input_dictionary=input_dictionary)
+            ads_dens = _get_density(temperature_guess)
 
             volume_computed = physics.get_adsorption_volume(
                 adsorbed_amount=loading,
                 adsorbate_density=ads_dens)
 
-            return numpy.min(volume) - volume_computed
+            return minimum_volume - volume_computed
 
-        minimum_temperature = scipy.optimize.fsolve(minimum_temperature_function, x0=273)[0]
-        maximum_temperature = scipy.optimize.fsolve(maximum_temperature_function, x0=273)[0]
+        minimum_temperature = _find_temperature(minimum_temperature_function)
+        maximum_temperature = _find_temperature(maximum_temperature_function)
 
         logger.info(f"Obtained isostere interval between {minimum_temperature} MPa and {maximum_temperature} MPa.")
         return [minimum_temperature, maximum_temperature]
@@ -1360,45 +1601,28 @@ def predict_data(data_dictionary: dict, input_dictionary: dict, prediction_type:
     def predict_isotherm():
         logger.info(f"Starting isotherm prediction procedure.")
 
+        pressure_range = input_dictionary[0]['PREDICTION_PRESSURE_RANGE']
+        number_pressures = int(input_dictionary[0]['NUMBER_PRESSURE_POINTS'])
+
         prediction_dictionary = {}
         for index, temperature in enumerate(input_dictionary[0]['PREDICTION_TEMPERATURES']):
             logger.info(f"Predicting isotherm at {temperature} K.")
 
             prediction_dictionary[index] = {}
             prediction_dictionary[index]['temperature'] = temperature
-            prediction_dictionary[index]['saturation_pressure'] = compute_saturation_pressure_from_method(
-                method=input_dictionary[0]['ADSORBATE_SATURATION_PRESSURE'],
-                temperature=temperature,
-                properties_dictionary=properties_dictionary,
-                saturation_pressure_file=input_dictionary[0]['SATURATION_PRESSURE_FILE'],
-                input_dictionary=input_dictionary)
-
-            prediction_dictionary[index]['density'] = compute_density_from_method(
-                method=input_dictionary[0]['ADSORBATE_DENSITY'],
-                temperature=temperature,
-                properties_dictionary=properties_dictionary,
-                input_dictionary=input_dictionary)
+            prediction_dictionary[index]['saturation_pressure'] = _get_saturation_pressure(temperature)
+            prediction_dictionary[index]['density'] = _get_density(temperature)
 
             boundaries = _get_pressure_boundaries(
                 temperature=temperature,
                 potential=data_dictionary[0]['potential'])
 
-            if (input_dictionary[0]['PREDICTION_PRESSURE_RANGE'] is not None and
-                    boundaries[0] <= input_dictionary[0]['PREDICTION_PRESSURE_RANGE'][0] <= boundaries[1]):
-                start_pressure = input_dictionary[0]['PREDICTION_PRESSURE_RANGE'][0]
-            else:
-                start_pressure = boundaries[0]
-
-            if (input_dictionary[0]['PREDICTION_PRESSURE_RANGE'] is not None and
-                    start_pressure <= input_dictionary[0]['PREDICTION_PRESSURE_RANGE'][1] <= boundaries[1]):
-                end_pressure = input_dictionary[0]['PREDICTION_PRESSURE_RANGE'][1]
-            else:
-                end_pressure = boundaries[1]
+            start_pressure, end_pressure = _get_prediction_interval(pressure_range, boundaries)
 
             prediction_dictionary[index]['pressure'] = numpy.geomspace(
                 start=start_pressure,
                 stop=end_pressure,
-                num=int(input_dictionary[0]['NUMBER_PRESSURE_POINTS']))
+                num=number_pressures)
 
             potential_range = physics.get_adsorption_potential(
                 temperature=prediction_dictionary[index]['temperature'],
@@ -1413,6 +1637,9 @@ def predict_data(data_dictionary: dict, input_dictionary: dict, prediction_type:
     def predict_isobar():
         logger.info(f"Starting isobar prediction procedure.")
 
+        temperature_range = input_dictionary[0]['PREDICTION_TEMPERATURE_RANGE']
+        number_temperatures = int(input_dictionary[0]['NUMBER_TEMPERATURE_POINTS'])
+
         prediction_dictionary = {}
         for index, pressure in enumerate(input_dictionary[0]['PREDICTION_PRESSURES']):
             logger.info(f"Predicting isobar at {pressure} MPa.")
@@ -1423,42 +1650,24 @@ def predict_data(data_dictionary: dict, input_dictionary: dict, prediction_type:
                 pressure=pressure,
                 potential=data_dictionary[0]['potential'])
 
-            if (input_dictionary[0]['PREDICTION_TEMPERATURE_RANGE'] is not None and
-                    boundaries[0] <= input_dictionary[0]['PREDICTION_TEMPERATURE_RANGE'][0] <= boundaries[1]):
-                start_temperature = input_dictionary[0]['PREDICTION_TEMPERATURE_RANGE'][0]
-            else:
-                start_temperature = boundaries[0]
-
-            if (input_dictionary[0]['PREDICTION_TEMPERATURE_RANGE'] is not None and
-                    start_temperature <= input_dictionary[0]['PREDICTION_TEMPERATURE_RANGE'][1] <= boundaries[1]):
-                end_temperature = input_dictionary[0]['PREDICTION_TEMPERATURE_RANGE'][1]
-            else:
-                end_temperature = boundaries[1]
+            start_temperature, end_temperature = _get_prediction_interval(temperature_range, boundaries)
 
             prediction_dictionary[index]['temperature'] = numpy.linspace(
                 start=start_temperature,
                 stop=end_temperature,
-                num=int(input_dictionary[0]['NUMBER_TEMPERATURE_POINTS']))
+                num=number_temperatures)
 
-            saturation_pressure_list = []
-            density_list = []
-
-            for temperature in prediction_dictionary[index]['temperature']:
-                saturation_pressure_list.append(compute_saturation_pressure_from_method(
-                    method=input_dictionary[0]['ADSORBATE_SATURATION_PRESSURE'],
-                    temperature=temperature,
-                    properties_dictionary=properties_dictionary,
-                    saturation_pressure_file=input_dictionary[0]['SATURATION_PRESSURE_FILE'],
-                    input_dictionary=input_dictionary))
-
-                density_list.append(compute_density_from_method(
-                    method=input_dictionary[0]['ADSORBATE_DENSITY'],
-                    temperature=temperature,
-                    properties_dictionary=properties_dictionary,
-                    input_dictionary=input_dictionary))
-
-            prediction_dictionary[index]['saturation_pressure'] = numpy.array(saturation_pressure_list)
-            prediction_dictionary[index]['density'] = numpy.array(density_list)
+            prediction_dictionary[index]['saturation_pressure'] = compute_saturation_pressure_array(
+                method=saturation_pressure_method,
+                temperatures=prediction_dictionary[index]['temperature'],
+                properties_dictionary=properties_dictionary,
+                saturation_pressure_file=saturation_pressure_file,
+                input_dictionary=input_dictionary)
+            prediction_dictionary[index]['density'] = compute_density_from_method(
+                method=density_method,
+                temperature=prediction_dictionary[index]['temperature'],
+                properties_dictionary=properties_dictionary,
+                input_dictionary=input_dictionary)
 
             potential_range = physics.get_adsorption_potential(
                 temperature=prediction_dictionary[index]['temperature'],
@@ -1474,6 +1683,9 @@ def predict_data(data_dictionary: dict, input_dictionary: dict, prediction_type:
     def predict_isostere():
         logger.info(f"Starting isostere prediction procedure.")
 
+        temperature_range = input_dictionary[0]['PREDICTION_ISOSTERE_RANGE']
+        number_temperatures = int(input_dictionary[0]['NUMBER_ISOSTERE_POINTS'])
+
         prediction_dictionary = {}
         for index, loading in enumerate(input_dictionary[0]['PREDICTION_LOADINGS']):
             logger.info(f"Predicting isostere at {loading} mg/g.")
@@ -1487,42 +1699,24 @@ def predict_data(data_dictionary: dict, input_dictionary: dict, prediction_type:
 
             boundaries.sort()
 
-            if (input_dictionary[0]['PREDICTION_ISOSTERE_RANGE'] is not None and
-                    boundaries[0] <= input_dictionary[0]['PREDICTION_ISOSTERE_RANGE'][0] <= boundaries[1]):
-                start_temperature = input_dictionary[0]['PREDICTION_ISOSTERE_RANGE'][0]
-            else:
-                start_temperature = boundaries[0]
-
-            if (input_dictionary[0]['PREDICTION_ISOSTERE_RANGE'] is not None and
-                    start_temperature <= input_dictionary[0]['PREDICTION_ISOSTERE_RANGE'][1] <= boundaries[1]):
-                end_temperature = input_dictionary[0]['PREDICTION_ISOSTERE_RANGE'][1]
-            else:
-                end_temperature = boundaries[1]
+            start_temperature, end_temperature = _get_prediction_interval(temperature_range, boundaries)
 
             prediction_dictionary[index]['temperature'] = numpy.linspace(
                 start=start_temperature,
                 stop=end_temperature,
-                num=int(input_dictionary[0]['NUMBER_ISOSTERE_POINTS']))
-
-            saturation_pressure_list = []
-            density_list = []
-
-            for temperature in prediction_dictionary[index]['temperature']:
-                saturation_pressure_list.append(compute_saturation_pressure_from_method(
-                    method=input_dictionary[0]['ADSORBATE_SATURATION_PRESSURE'],
-                    temperature=temperature,
-                    properties_dictionary=properties_dictionary,
-                    saturation_pressure_file=input_dictionary[0]['SATURATION_PRESSURE_FILE'],
-                    input_dictionary=input_dictionary))
-
-                density_list.append(compute_density_from_method(
-                    method=input_dictionary[0]['ADSORBATE_DENSITY'],
-                    temperature=temperature,
-                    properties_dictionary=properties_dictionary,
-                    input_dictionary=input_dictionary))
+                num=number_temperatures)
 
-            prediction_dictionary[index]['saturation_pressure'] = numpy.array(saturation_pressure_list)
-            prediction_dictionary[index]['density'] = numpy.array(density_list)
+            prediction_dictionary[index]['saturation_pressure'] = compute_saturation_pressure_array(
+                method=saturation_pressure_method,
+                temperatures=prediction_dictionary[index]['temperature'],
+                properties_dictionary=properties_dictionary,
+                saturation_pressure_file=saturation_pressure_file,
+                input_dictionary=input_dictionary)
+            prediction_dictionary[index]['density'] = compute_density_from_method(
+                method=density_method,
+                temperature=prediction_dictionary[index]['temperature'],
+                properties_dictionary=properties_dictionary,
+                input_dictionary=input_dictionary)
 
             volume_range = physics.get_adsorption_volume(
                 adsorbed_amount=loading,
@@ -1541,10 +1735,9 @@ def predict_data(data_dictionary: dict, input_dictionary: dict, prediction_type:
         "isostere": predict_isostere
     }
 
-    volume_interpolation_function = scipy.interpolate.interp1d(
+    volume_interpolation_function = _linear_interpolation(
         x=data_dictionary[0]['potential'],
-        y=data_dictionary[0]['volume'],
-        fill_value="extrapolate")
+        y=data_dictionary[0]['volume'])
 
     potential_interpolation_function = scipy.interpolate.CubicSpline(
         x=data_dictionary[0]['volume'],
@@ -1562,39 +1755,8 @@ def predict_data(data_dictionary: dict, input_dictionary: dict, prediction_type:
 
 def compute_adsorption_enthalpy(data_dictionary: dict, input_dictionary: dict, properties_dictionary: dict) -> dict:
 
-    def _get_isostere_boundaries(loading: float, volume: numpy.ndarray) -> list:
+    density_method = input_dictionary[0]['ADSORBATE_DENSITY']
 
-        def minimum_temperature_function(temperature_guess: float) -> float:
-            ads_dens = compute_density_from_method(
-                method=input_dictionary[0]['ADSORBATE_DENSITY'],
-                temperature=temperature_guess,
-                properties_dictionary=properties_dictionary,
-                input_dictionary=input_dictionary)
-
-            volume_computed = physics.get_adsorption_volume(
-                adsorbed_amount=loading,
-                adsorbate_density=ads_dens)
-
-            return numpy.max(volume) - volume_computed
-
-        def maximum_temperature_function(temperature_guess: float) -> float:
-            ads_dens = compute_density_from_method(
-                method=input_dictionary[0]['ADSORBATE_DENSITY'],
-                temperature=temperature_guess,
-                properties_dictionary=properties_dictionary,
-                input_dictionary=input_dictionary)
-
-            volume_computed = physics.get_adsorption_volume(
-                adsorbed_amount=loading,
-                adsorbate_density=ads_dens)
-
-            return numpy.min(volume) - volume_computed
-
-        minimum_temperature = scipy.optimize.fsolve(minimum_temperature_function, x0=273)[0]
-        maximum_temperature = scipy.optimize.fsolve(maximum_temperature_function, x0=273)[0]
-
-        return [minimum_temperature, maximum_temperature]
-    
     potential_interpolation_function = scipy.interpolate.PchipInterpolator(
         x=data_dictionary[0]['volume'],
         y=data_dictionary[0]['potential'])
@@ -1606,43 +1768,32 @@ def compute_adsorption_enthalpy(data_dictionary: dict, input_dictionary: dict, p
 
     enthalpy_dictionary = {"loading": loadings, "enthalpy": []}
 
+    # The temperatures, and therefore the saturation pressures and densities, are the same for every loading
+    temperatures_range = numpy.linspace(
+        start=input_dictionary[0]['ENTHALPY_TEMPERATURE_RANGE'][0],
+        stop=input_dictionary[0]['ENTHALPY_TEMPERATURE_RANGE'][1],
+        num=3)
+    saturation_pressures = compute_saturation_pressure_array(
+        method=input_dictionary[0]['ADSORBATE_SATURATION_PRESSURE'],
+        temperatures=temperatures_range,
+        properties_dictionary=properties_dictionary,
+        saturation_pressure_file=input_dictionary[0]['SATURATION_PRESSURE_FILE'],
+        input_dictionary=input_dictionary)
+    densities = compute_density_from_method(
+        method=density_method,
+        temperature=temperatures_range,
+        properties_dictionary=properties_dictionary,
+        input_dictionary=input_dictionary)
+
     prediction_dictionary = {}
-    plt.figure()
+    figure = plt.figure()
     for index, loading in enumerate(loadings):
         prediction_dictionary[index] = {}
         prediction_dictionary[index]['loading'] = loading
 
-        boundaries = _get_isostere_boundaries(
-            loading=loading,
-            volume=data_dictionary[0]['volume'])
-
-        boundaries.sort()
-        boundaries[0] = max(boundaries[0], 0)
-
-        prediction_dictionary[index]['temperature'] = numpy.linspace(
-            start=input_dictionary[0]['ENTHALPY_TEMPERATURE_RANGE'][0],
-            stop=input_dictionary[0]['ENTHALPY_TEMPERATURE_RANGE'][1],
-            num=3)
-
-        saturation_pressure_list = []
-        density_list = []
-
-        for temperature in prediction_dictionary[index]['temperature']:
-            saturation_pressure_list.append(compute_saturation_pressure_from_method(
-                method=input_dictionary[0]['ADSORBATE_SATURATION_PRESSURE'],
-                temperature=temperature,
-                properties_dictionary=properties_dictionary,
-                saturation_pressure_file=input_dictionary[0]['SATURATION_PRESSURE_FILE'],
-                input_dictionary=input_dictionary))
-
-            density_list.append(compute_density_from_method(
-                method=input_dictionary[0]['ADSORBATE_DENSITY'],
-                temperature=temperature,
-                properties_dictionary=properties_dictionary,
-                input_dictionary=input_dictionary))
-
-        prediction_dictionary[index]['saturation_pressure'] = numpy.array(saturation_pressure_list)
-        prediction_dictionary[index]['density'] = numpy.array(density_list)
+        prediction_dictionary[index]['temperature'] = temperatures_range
+        prediction_dictionary[index]['saturation_pressure'] = saturation_pressures
+        prediction_dictionary[index]['density'] = densities
 
         volume_range = physics.get_adsorption_volume(
             adsorbed_amount=loading,
@@ -1680,6 +1831,10 @@ def compute_adsorption_enthalpy(data_dictionary: dict, input_dictionary: dict, p
 
         enthalpy_dictionary['enthalpy'].append(-opt[0])
 
+    # The fit figure is only kept open when it is shown at the end of the run, as in plot_data
+    if input_dictionary[0]['SHOW_PLOTS'].lower() != "yes":
+        plt.close(figure)
+
     return enthalpy_dictionary
 
 
@@ -1690,49 +1845,10 @@ def convert_input(unit: str, molecular_mass: float) -> float:
     :param molecular_mass: The molecular mass of the molecule.
     :return: A number that the input is multiplied with to be converted to the intended unit.
     """
-    # Pressure
-    if unit == "MPa":
-        conversion_factor = 1
-    elif unit == "kPa":
-        conversion_factor = 0.001
-    elif unit == "Pa":
-        conversion_factor = 0.000001
-    elif unit == "bar":
-        conversion_factor = 0.1
-    elif unit == "atm":
-        conversion_factor = 0.09869232667160
-    elif unit == "Torr":
-        conversion_factor = 0.000133322
-    elif unit == "mmHg":
-        conversion_factor = 133.322 * 0.000001
-
-    # Temperature
-    elif unit == "K":
-        conversion_factor = 1
-    elif unit == "R":
-        conversion_factor = 1.8
-
-    # Adsorbed amount
-    elif unit in ["mg/g", "g/kg"]:
-        conversion_factor = 1
-    elif unit in ["mol/kg", "mmol/g"]:
+    if unit in UNIT_CONVERSION_FACTORS:
+        conversion_factor = UNIT_CONVERSION_FACTORS[unit]
+    elif unit in MOLAR_UNITS:
         conversion_factor = molecular_mass
-    # elif unit in ["cm3/g", "mm3/mg", "dm3/kg", "l/kg", "ml/g"]:
-    #     conversion_factor = molecular_mass / 22.4139757476
-
-    # Adsorption potential
-    elif unit == "kJ/mol":
-        conversion_factor = 1
-    elif unit == "J/mol":
-        conversion_factor = 0.001
-
-    # Adsorption volume
-    elif unit in ["ml/g", "l/kg", "cm3/g", "dm3/kg"]:
-        conversion_factor = 1
-
-    # Density
-    elif unit == "kg/m3":
-        conversion_factor = 1
 
     # Not a recognized unit
     else:
@@ -16,13 +16,15 @@ Currently supported methods are:
     10. Linear equation for critical isochore after the critical point.
 
 All methods take as input the temperature and a set of material dependent parameters and return a float value
-representing the saturation pressure of the adsorbate in megapascals (MPa). In case different pressure units are needed,
-the output value can be converted from MPa using the function utils.convert_output(). Changing the units inside the
-functions is not recommended, as it may break other modules that make use of this file.
+representing the saturation pressure of the adsorbate in megapascals (MPa). The fugacity equilibrations are solved
+iteratively, so their results are cached for every set of arguments they are called with. In case different pressure
+units are needed, the output value can be converted from MPa using the function utils.convert_output(). Changing the
+units inside the functions is not recommended, as it may break other modules that make use of this file.
 """
 
 # Standard libraries
 import warnings
+import functools
 import importlib.resources
 
 # Local libraries
@@ -66,6 +68,23 @@ def amankwah(temperature: float, temperature_critical: float, pressure_critical:
     return pressure_critical * (temperature / temperature_critical) ** k
 
 
+@functools.lru_cache(maxsize=None)
+def _get_extrapolator(file) -> tuple:
+    """
+    Build the cubic spline used inside the range of a saturation pressure data file and the quadratic fit used above
+    it, cached per file.
+
+    :param file: Path to file containing reference data.
+    :return: Tuple containing the highest temperature in the file, the cubic spline through the data, and the
+    coefficients of the second order polynomial fit.
+    """
+    temperatures, pressures = input_reader.create_sorted_columns(file)
+
+    interpolation_function = scipy.interpolate.CubicSpline(temperatures, pressures, extrapolate=True)
+    coefficients = numpy.polyfit(temperatures, pressures, deg=2)
+    return temperatures[-1], interpolation_function, coefficients
+
+
 def extrapolation(temperature: float, file: str, adsorbate_name: str) -> float:
     """
     Calculates the saturation pressure by extrapolating the data found in a data file.
@@ -74,27 +93,27 @@ def extrapolation(temperature: float, file: str, adsorbate_name: str) -> float:
     saturation pressure. For the extrapolation, a second order polynomial is used. If the input temperature is found in
     the temperature range covered by the data file, interpolation is used to determine the value.
 
-    :param temperature: Temperature at which the experiment is conducted in K.
+    :param temperature: Temperature at which the experiment is conducted in K, either a float or a numpy array.
     :param file: Path to file containing reference data.
-    :return: Saturation pressure in the same units as the input file.
+    :return: Saturation pressure in the same units as the input file, with the same shape as the temperature.
     """
 
     if file == "local":
         file = importlib.resources.files("retmap").joinpath(f"library/saturation-pressure/{adsorbate_name}.dat")
 
-    data = input_reader.create_data_list(file)
-    data = numpy.array(data)
+    maximum_temperature, interpolation_function, coefficients = _get_extrapolator(file)
 
-    def fit_function(x, a, b, c):
-        return a * x**2 + b * x + c
+    temperature = numpy.asarray(temperature, dtype=float)
+    in_range = temperature <= maximum_temperature
+    saturation_pressure = numpy.empty_like(temperature)
 
-    if temperature <= numpy.max(data[:, 0]):
-        interpolation_function = scipy.interpolate.CubicSpline(data[:, 0], data[:, 1], extrapolate=True)
-        return interpolation_function(temperature)
-    else:
-        # noinspection PyTupleAssignmentBalance
-        popt, pcov = scipy.optimize.curve_fit(fit_function, data[:, 0], data[:, 1])
-        return fit_function(temperature, *popt)
+    # Evaluate all temperatures of a branch in a single call
+    saturation_pressure[in_range] = interpolation_function(temperature[in_range])
+    saturation_pressure[~in_range] = numpy.polyval(coefficients, temperature[~in_range])
+
+    if saturation_pressure.ndim == 0:
+        return saturation_pressure.item()
+    return saturation_pressure
 
 
 def polynomial_water(temperature: float) -> float:
@@ -107,11 +126,13 @@ def polynomial_water(temperature: float) -> float:
     :param temperature: Temperature at which the experiment is conducted in K.
     :return: Saturation pressure in MPa.
     """
-    return (- 1.14798e-11 * temperature**7 + 2.23756e-8 * temperature**6 - 1.54376e-5 * temperature**5
-            + 0.00443279 * temperature**4 - 0.177671 * temperature**3 - 193.14 * temperature**2
-            + 42890.6 * temperature - 2.87726e+6) / 1_000_000
+    # The polynomial is evaluated in Horner form, which avoids computing the powers of the temperature separately
+    return ((((((((- 1.14798e-11 * temperature + 2.23756e-8) * temperature - 1.54376e-5) * temperature
+                 + 0.00443279) * temperature - 0.177671) * temperature - 193.14) * temperature + 42890.6)
+             * temperature - 2.87726e+6) / 1_000_000)
 
 
+@functools.lru_cache(maxsize=4096)
 def pengrobinson(temperature: float, temperature_critical: float, pressure_critical: float, pressure_guess: float,
                  acentric_factor: float) -> float:
     """
@@ -167,6 +188,7 @@ def pengrobinson(temperature: float, temperature_critical: float, pressure_criti
     return abs(scipy.optimize.fsolve(func=fugacity_ratio, x0=numpy.array(pressure_guess))[0])
 
 
+@functools.lru_cache(maxsize=4096)
 def prsv1(temperature: float, temperature_critical: float, pressure_critical: float, pressure_guess: float,
           acentric_factor: float, kappa1: float) -> float:
     """
@@ -224,6 +246,7 @@ def prsv1(temperature: float, temperature_critical: float, pressure_critical: fl
     return abs(scipy.optimize.fsolve(func=fugacity_ratio, x0=numpy.array(pressure_guess))[0])
 
 
+@functools.lru_cache(maxsize=4096)
 def prsv2(temperature: float, temperature_critical: float, pressure_critical: float, pressure_guess: float,
           acentric_factor: float, kappa1: float, kappa2: float, kappa3: float) -> float:
     """
@@ -283,28 +306,15 @@ def prsv2(temperature: float, temperature_critical: float, pressure_critical: fl
     return abs(scipy.optimize.fsolve(func=fugacity_ratio, x0=numpy.array(pressure_guess))[0])
 
 
-def equation_extrapolation(temperature: float, temperature_critical: float, pressure_critical: float,
-                           acentric_factor: float, temperature_boiling: float, equation: str, kappa1: float,
-                           kappa2: float, kappa3: float, function: str) -> float:
+@functools.lru_cache(maxsize=None)
+def _get_subcritical_pressures(temperature_critical: float, pressure_critical: float, acentric_factor: float,
+                               temperature_boiling: float, equation: str, kappa1: float, kappa2: float,
+                               kappa3: float) -> tuple:
     """
-    Calculates the saturation pressure above the critical point by extrapolating the results of Peng-Robinson's
-    equation of state, PRSV1 equation or PRSV2 equation.
-
-    For the extrapolation, the user can choose between a second order polynomial, Amankwah's equation, and a custom
-    equation. If the input temperature is found in the temperature range covered by the data file, interpolation is used
-    to determine the value.
+    Compute the saturation pressures between the boiling and the critical temperature using the given equation. The
+    result is cached, so the curve is only solved once for every adsorbate and equation.
 
-    :param temperature: Temperature at which the experiment is conducted in K.
-    :param temperature_critical: Critical temperature of the adsorbate in K.
-    :param pressure_critical: Critical pressure of the adsorbate in MPa.
-    :param acentric_factor: The acentric factor of the adsorbate.
-    :param temperature_boiling: Boiling temperature of the adsorbate in K.
-    :param equation: Equation used below the critical point; preos, prsv1, or prsv2.
-    :param kappa1: First molecule specific constant, given in the PRSV1 paper.
-    :param kappa2: Second molecule specific constant, given in the PRSV2 paper.
-    :param kappa3: Third molecule specific constant, given in the PRSV2 paper.
-    :param function: Function used for the extrapolation of the results above the critical temperature.
-    :return: Saturation pressure in MPa.
+    :return: Tuple containing the temperatures, from the boiling temperature upwards, and the saturation pressures.
     """
 
     temp_range = numpy.linspace(start=temperature_boiling, stop=temperature_critical, num=50)
@@ -335,7 +345,39 @@ def equation_extrapolation(temperature: float, temperature_critical: float, pres
     else:
         raise ValueError(f"Equation type {equation} is not 'preos', 'prsv1' or 'prsv2'. Check the string!")
 
+    # The curve is solved downwards from the critical point, but returned in increasing order of the temperature
     subcritical_pressures = numpy.array(subcritical_pressures)
+    return temp_range[::-1], subcritical_pressures[::-1]
+
+
+def equation_extrapolation(temperature: float, temperature_critical: float, pressure_critical: float,
+                           acentric_factor: float, temperature_boiling: float, equation: str, kappa1: float,
+                           kappa2: float, kappa3: float, function: str) -> float:
+    """
+    Calculates the saturation pressure above the critical point by extrapolating the results of Peng-Robinson's
+    equation of state, PRSV1 equation or PRSV2 equation.
+
+    For the extrapolation, the user can choose between a second order polynomial, Amankwah's equation, and a custom
+    equation. If the input temperature is found in the temperature range covered by the data file, interpolation is used
+    to determine the value.
+
+    :param temperature: Temperature at which the experiment is conducted in K.
+    :param temperature_critical: Critical temperature of the adsorbate in K.
+    :param pressure_critical: Critical pressure of the adsorbate in MPa.
+    :param acentric_factor: The acentric factor of the adsorbate.
+    :param temperature_boiling: Boiling temperature of the adsorbate in K.
+    :param equation: Equation used below the critical point; preos, prsv1, or prsv2.
+    :param kappa1: First molecule specific constant, given in the PRSV1 paper.
+    :param kappa2: Second molecule specific constant, given in the PRSV2 paper.
+    :param kappa3: Third molecule specific constant, given in the PRSV2 paper.
+    :param function: Function used for the extrapolation of the results above the critical temperature.
+    :return: Saturation pressure in MPa.
+    """
+
+    temp_range, subcritical_pressures = _get_subcritical_pressures(
+        temperature_critical=temperature_critical, pressure_critical=pressure_critical,
+        acentric_factor=acentric_factor, temperature_boiling=temperature_boiling, equation=equation, kappa1=kappa1,
+        kappa2=kappa2, kappa3=kappa3)
 
     if function == "polynomial2":
         def fit_function(x, a, b, c):
@@ -350,14 +392,47 @@ def equation_extrapolation(temperature: float, temperature_critical: float, pres
         raise ValueError(f"No known function {function}!")
 
     if temperature <= temperature_critical:
-        interpolation_function = scipy.interpolate.interp1d(temp_range, subcritical_pressures, fill_value="extrapolate")
-        return interpolation_function(temperature)
+        # Below the boiling temperature the first interval of the curve is extended linearly
+        if temperature < temp_range[0]:
+            slope = (subcritical_pressures[1] - subcritical_pressures[0]) / (temp_range[1] - temp_range[0])
+            return subcritical_pressures[0] + slope * (temperature - temp_range[0])
+        return numpy.interp(temperature, temp_range, subcritical_pressures)
+    elif function == "polynomial2":
+        # The polynomial is linear in its coefficients, so the least-squares fit is solved directly
+        popt = numpy.polyfit(temp_range, subcritical_pressures, deg=2)
+        return fit_function(temperature, *popt)
     else:
         # noinspection PyTupleAssignmentBalance
         popt, pcov = scipy.optimize.curve_fit(fit_function, temp_range, subcritical_pressures)
         return fit_function(temperature, *popt)
 
 
+def _subcritical_pengrobinson(temperature: numpy.ndarray, saturation_pressure: numpy.ndarray,
+                              temperature_critical: float, pressure_critical: float,
+                              acentric_factor: float) -> numpy.ndarray:
+    """
+    Replace the saturation pressures below the critical temperature with the ones given by the Peng-Robinson equation
+    of state, which has to be solved for each temperature separately.
+
+    :param temperature: Temperatures at which the experiment is conducted in K.
+    :param saturation_pressure: Saturation pressures computed for all temperatures in MPa.
+    :param temperature_critical: Critical temperature of the adsorbate in K.
+    :param pressure_critical: Critical pressure of the adsorbate in MPa.
+    :param acentric_factor: The acentric factor of the adsorbate.
+    :return: Saturation pressure in MPa, as a float for a single temperature or as a numpy array otherwise.
+    """
+    saturation_pressure = numpy.array(saturation_pressure, dtype=float)
+    subcritical = temperature < temperature_critical
+    saturation_pressure[subcritical] = [
+        pengrobinson(temperature=float(subcritical_temperature), temperature_critical=temperature_critical,
+                     pressure_critical=pressure_critical, pressure_guess=0.001, acentric_factor=acentric_factor)
+        for subcritical_temperature in numpy.atleast_1d(temperature[subcritical])]
+
+    if saturation_pressure.ndim == 0:
+        return saturation_pressure.item()
+    return saturation_pressure
+
+
 def widombanuti(temperature: float, temperature_critical: float, pressure_critical: float,
                 species_parameter: float, acentric_factor: float) -> float:
     """
@@ -365,33 +440,30 @@ def widombanuti(temperature: float, temperature_critical: float, pressure_critic
 
     Source material: https://doi.org/10.1103/PhysRevE.95.052120.
 
-    :param temperature: Temperature at which the experiment is conducted in K.
+    :param temperature: Temperature at which the experiment is conducted in K, either a float or a numpy array.
     :param temperature_critical: Critical temperature of the adsorbate in K.
     :param pressure_critical: Critical pressure of the adsorbate in MPa.
     :param species_parameter: Molecule specific constant, given in the source material.
     :param acentric_factor: The acentric factor of the adsorbate.
-    :return: Saturation pressure in MPa.
+    :return: Saturation pressure in MPa, with the same shape as the temperature.
     """
-    if temperature >= temperature_critical:
-        return numpy.exp(species_parameter*(temperature/temperature_critical - 1)) * pressure_critical
-    else:
-        return pengrobinson(temperature=temperature, temperature_critical=temperature_critical,
-                            pressure_critical=pressure_critical, pressure_guess=0.001, acentric_factor=acentric_factor)
+    temperature = numpy.asarray(temperature, dtype=float)
+    saturation_pressure = numpy.exp(species_parameter*(temperature/temperature_critical - 1)) * pressure_critical
+    return _subcritical_pengrobinson(temperature, saturation_pressure, temperature_critical, pressure_critical,
+                                     acentric_factor)
 
 
 def critical_isochore_model(temperature: float, temperature_critical: float, pressure_critical: float,
                             acentric_factor: float) -> float:
     """
     Calculate the pressure on the critical isochore using an empirical model.
-    :param temperature: Temperature at which the experiment is conducted in K.
+    :param temperature: Temperature at which the experiment is conducted in K, either a float or a numpy array.
     :param temperature_critical: Critical temperature of the adsorbate in K.
     :param pressure_critical: Critical pressure of the adsorbate in MPa.
     :param acentric_factor: The acentric factor of the adsorbate.
-    :return: Saturation pressure in MPa.
+    :return: Saturation pressure in MPa, with the same shape as the temperature.
     """
-    if temperature >= temperature_critical:
-        return temperature * 5.65 * pressure_critical / temperature_critical
-    else:
-        return pengrobinson(temperature=temperature, temperature_critical=temperature_critical,
-                            pressure_critical=pressure_critical, pressure_guess=0.001, acentric_factor=acentric_factor)
-
+    temperature = numpy.asarray(temperature, dtype=float)
+    saturation_pressure = temperature * 5.65 * pressure_critical / temperature_critical
+    return _subcritical_pengrobinson(temperature, saturation_pressure, temperature_critical, pressure_critical,
+                                     acentric_factor)
@@ -1,5 +1,6 @@
 import unittest
 import logging
+import numpy
 from retmap import density
 
 
@@ -23,6 +24,20 @@ class TestDensityCase(unittest.TestCase):
         result = density.extrapolation(100, "local", "Ar")
         self.assertTrue(isinstance(result, (float, int)))
 
+    def test_array(self):
+        # The extrapolation data of argon ends at 150 K, just below its critical temperature of 150.687 K
+        cases = [
+            (density.ozawa, numpy.array([80.0, 100.0, 120.0, 200.0]), 87.3, 1395.4, 0.00165),
+            (density.hauer, numpy.array([80.0, 100.0, 120.0, 200.0]), 87.3, 1395.4, 0.00165),
+            (density.extrapolation, numpy.array([80.0, 90.0, 100.0, 150.0, 160.0, 1000.0]), "local", "Ar"),
+        ]
+        for function, temperatures, *args in cases:
+            result = function(temperatures, *args)
+            self.assertEqual(result.shape, temperatures.shape)
+            for temperature, value in zip(temperatures, result):
+                with self.subTest(function=function.__name__, temperature=temperature):
+                    self.assertAlmostEqual(value, function(temperature, *args))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+import warnings
+from retmap import input_reader
+
+
+class TestInputReaderCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_file(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def test_create_input_dictionary(self):
+        path = self.write_file("config.in", "DATA_FILES a.dat b.dat\nDATA_TYPES isotherm\nTEMPERATURES 77 87\n\n"
+                                            "ADSORBATE Ar\nPREDICTION_TEMPERATURES 90 100 110\nUNKNOWN_TAG 1\n"
+                                            "ADSORBENT x y z\nADSORBATE_DENSITY Ozawa\n")
+        result = input_reader.create_input_dictionary(path)
+        self.assertEqual(list(result.keys()), [0, 1])
+        self.assertEqual(result[0]['DATA_FILES'], "a.dat")
+        self.assertEqual(result[1]['DATA_FILES'], "b.dat")
+        self.assertEqual(result[1]['DATA_TYPES'], "isotherm")
+        self.assertEqual(result[0]['TEMPERATURES'], 77.0)
+        self.assertEqual(result[1]['TEMPERATURES'], 87.0)
+        self.assertEqual(result[1]['ADSORBATE'], "Ar")
+        self.assertEqual(result[0]['PREDICTION_TEMPERATURES'].tolist(), [90.0, 100.0, 110.0])
+        self.assertIsNot(result[0]['PREDICTION_TEMPERATURES'], result[1]['PREDICTION_TEMPERATURES'])
+        self.assertIsNone(result[0]['ADSORBENT'])
+        self.assertEqual(result[0]['PRESSURE_UNITS'], "MPa")
+        self.assertNotIn('UNKNOWN_TAG', result[0])
+        self.assertEqual(result[1]['ADSORBATE_DENSITY'], "ozawa")
+
+    def test_create_input_dictionary_wrong_list(self):
+        path = self.write_file("config.in", "DATA_FILES a.dat\nPREDICTION_PRESSURES 0.1 abc\n")
+        with self.assertRaises(ValueError):
+            input_reader.create_input_dictionary(path)
+
+    def test_create_properties_dictionary_missing_tags(self):
+        path = self.write_file("Ar.prop", "NAME Ar\nMOLECULAR_MASS 39.948\nACENTRIC_FACTOR 0.0\n")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            result = input_reader.create_properties_dictionary(path, "Ar")
+        self.assertEqual(result['MOLECULAR_MASS'], 39.948)
+        self.assertEqual(result['ACENTRIC_FACTOR'], 0.0)
+        self.assertEqual(len(caught), 1)
+        self.assertIn("PRESSURE_CRITICAL", str(caught[0].message))
+        self.assertNotIn("ACENTRIC_FACTOR", str(caught[0].message))
+
+    def test_create_data_list_two_columns(self):
+        path = self.write_file("isotherm.dat", "# Pressure [MPa] \t Loading [mg/g]\n0.1 10\n0.2 20\n\n0.3 30\n")
+        result = input_reader.create_data_list(path)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result[2][0], 0.3)
+        self.assertEqual(result[2][1], 30)
+
+    def test_create_data_list_parameters(self):
+        path = self.write_file("langmuir.dat", "0.001 1.0 30\n400\n20\n")
+        result = input_reader.create_data_list(path)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(int(result[0][2]), 30)
+        self.assertEqual(result[1][0], 400)
+        self.assertEqual(result[2][0], 20)
+
+    def test_create_data_list_wrong_entry(self):
+        path = self.write_file("wrong.dat", "0.1 10\n0.2 abc\n")
+        with self.assertRaises(ValueError):
+            input_reader.create_data_list(path)
+
+    def test_create_sorted_columns(self):
+        path = self.write_file("density.dat", "# Temperature [K] \t Density [kg/m3]\n120 900\n90 1300\n100 1200\n")
+        temperatures, densities = input_reader.create_sorted_columns(path)
+        self.assertEqual(temperatures.tolist(), [90.0, 100.0, 120.0])
+        self.assertEqual(densities.tolist(), [1300.0, 1200.0, 900.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import numpy
+import scipy.interpolate
+import scipy.optimize
+from retmap import interpreter
+
+
+class TestInterpreterCase(unittest.TestCase):
+    def test_find_temperature_root(self):
+        self.assertAlmostEqual(interpreter._find_temperature(lambda temperature: temperature - 300), 300)
+        self.assertAlmostEqual(interpreter._find_temperature(lambda temperature: 100 - temperature), 100)
+
+    def test_find_temperature_pole(self):
+        # Adsorption volume of a linear density model, which diverges at 700 K and has no root above 0 K
+        def function(temperature):
+            return 0.5 - 1 / (1 - temperature / 700)
+
+        result = interpreter._find_temperature(function)
+        self.assertGreater(abs(result - 700), 1)
+        self.assertEqual(result, scipy.optimize.fsolve(function, x0=273)[0])
+
+    def test_find_temperature_fallback(self):
+        def function(temperature):
+            return (temperature - 1000) ** 2 + 1
+
+        # The function has no root, so fsolve warns that it does not converge
+        with self.assertWarns(RuntimeWarning):
+            result = interpreter._find_temperature(function)
+        with self.assertWarns(RuntimeWarning):
+            expected = scipy.optimize.fsolve(function, x0=273)[0]
+        self.assertEqual(result, expected)
+
+    def test_format_columns(self):
+        first_column = numpy.array([0.1, -2.5, 1.23455, -0.00004, 123456.78915, 1e16, 0.00005])
+        second_column = numpy.array([10.0, -0.12345, 2.00005, 7.0, -1e-9, numpy.nan, 3.99995])
+
+        # Format of the rows as written one by one before the columns were formatted at once
+        expected = ""
+        for first, second in zip(first_column, second_column):
+            first = str(numpy.round(first, decimals=4)).rjust(11)
+            second = str(numpy.round(second, decimals=4)).rjust(11)
+            expected += f"{first} \t {second} \n"
+
+        self.assertEqual(interpreter._format_columns(first_column, second_column, decimals=4), expected)
+
+    def test_linear_interpolation(self):
+        # Unsorted data, evaluated inside the range and on both extrapolated sides
+        potential = numpy.array([5.0, 1.0, 3.0, 2.0, 8.0])
+        volume = numpy.array([0.1, 0.9, 0.4, 0.6, 0.05])
+        points = numpy.array([-2.0, 0.5, 1.0, 2.5, 4.0, 8.0, 12.0])
+
+        expected = scipy.interpolate.interp1d(potential, volume, fill_value="extrapolate")(points)
+        result = interpreter._linear_interpolation(potential, volume)(points)
+        numpy.testing.assert_allclose(result, expected)
+
+    def test_cache_per_temperature(self):
+        calls = []
+
+        def function(temperature, factor):
+            calls.append(temperature)
+            return factor * temperature
+
+        cached_function = interpreter._cache_per_temperature(function, 2)
+        self.assertEqual(cached_function(100.0), 200.0)
+        self.assertEqual(cached_function(numpy.array([100.0])), 200.0)
+        self.assertEqual(cached_function(150.0), 300.0)
+        self.assertEqual(calls, [100.0, 150.0])
+
+    def test_convert_input(self):
+        self.assertEqual(interpreter.convert_input("mmol/g", 39.948), 39.948)
+        self.assertEqual(interpreter.convert_input("kPa", 39.948), 0.001)
+        self.assertAlmostEqual(interpreter.convert_input("atm", 39.948), 0.0986923266716)
+        self.assertAlmostEqual(interpreter.convert_output("kPa", 39.948), 1000)
+
+    def test_convert_input_unknown_unit(self):
+        with self.assertRaises(ValueError):
+            interpreter.convert_input("xx", 39.948)
+
+
+if __name__ == '__main__':
+    unittest.main()
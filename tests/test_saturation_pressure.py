@@ -0,0 +1,36 @@
+import unittest
+import numpy
+from retmap import saturation_pressure
+
+
+class TestSaturationPressureCase(unittest.TestCase):
+    def test_array(self):
+        # Temperatures on both sides of the critical temperature of argon, and of the last tabulated temperature
+        cases = [
+            (saturation_pressure.dubinin, numpy.array([100.0, 160.0, 200.0, 300.0]), 150.7, 4.86),
+            (saturation_pressure.amankwah, numpy.array([100.0, 160.0, 200.0, 300.0]), 150.7, 4.86, 3.0),
+            (saturation_pressure.extrapolation, numpy.array([90.0, 120.0, 160.0, 1999.0, 2500.0]), "local", "Ar"),
+            # Below the critical temperature these methods call the Peng-Robinson solver, so only supercritical
+            # temperatures are used
+            (saturation_pressure.widombanuti, numpy.array([160.0, 200.0, 300.0]), 150.7, 4.86, 5.589, 0.0),
+            (saturation_pressure.critical_isochore_model, numpy.array([160.0, 200.0, 300.0]), 150.7, 4.86, 0.0),
+        ]
+        for function, temperatures, *args in cases:
+            result = function(temperatures, *args)
+            self.assertEqual(result.shape, temperatures.shape)
+            for temperature, value in zip(temperatures, result):
+                with self.subTest(function=function.__name__, temperature=temperature):
+                    self.assertAlmostEqual(value, function(temperature, *args))
+
+    def test_polynomial_water(self):
+        temperatures = numpy.array([300.0, 400.0, 500.0])
+        expected = (- 1.14798e-11 * temperatures**7 + 2.23756e-8 * temperatures**6 - 1.54376e-5 * temperatures**5
+                    + 0.00443279 * temperatures**4 - 0.177671 * temperatures**3 - 193.14 * temperatures**2
+                    + 42890.6 * temperatures - 2.87726e+6) / 1_000_000
+        result = saturation_pressure.polynomial_water(temperatures)
+        for value, expected_value in zip(result, expected):
+            self.assertAlmostEqual(value, expected_value, places=9)
+
+
+if __name__ == '__main__':
+    unittest.main()